@@ -2,40 +2,180 @@
 
 Provides simple messaging functions that wrap Agent Mail HTTP API.
 Requires BEADS_AGENT_MAIL_URL and BEADS_AGENT_NAME environment variables.
+
+Each operation is available as a coroutine (async_mail_send, async_mail_inbox, ...)
+for use on the MCP event loop, plus a blocking wrapper (mail_send, mail_inbox, ...)
+for synchronous callers that runs on a shared background loop.
 """
 
+import asyncio
+import atexit
+import base64
+import contextlib
+import functools
+import getpass
+import importlib.util
+import ipaddress
+import itertools
+import json
 import logging
 import os
-from typing import Any, Optional
-from urllib.parse import urljoin
-
-import requests
+import random
+import socket
+import threading
+import time
+import uuid
+import warnings
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Awaitable, Coroutine, Iterable, Iterator
+from operator import itemgetter
+from typing import Any, Optional, TypeVar
+from urllib.parse import urlparse
+
+import httpx
+
+try:
+    # Optional faster JSON codec (pip install 'beads-mcp[fast]')
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Timeout for Agent Mail HTTP requests (seconds)
 AGENT_MAIL_TIMEOUT = 5.0
 AGENT_MAIL_RETRIES = 2
 
+# Retry backoff bounds (seconds). Each delay is drawn uniformly from
+# [MIN, min(MAX, BASE * 2**attempt)] so concurrent clients don't retry in lockstep.
+AGENT_MAIL_BACKOFF_BASE = 0.5
+AGENT_MAIL_BACKOFF_MIN = 0.05
+AGENT_MAIL_BACKOFF_MAX = 5.0
+
+# Maximum number of requests a fan-out (mail_read_many, unbatched sweeps) keeps in flight
+AGENT_MAIL_CONCURRENCY = 16
+
+# Maximum number of operations sent in one batched request
+AGENT_MAIL_BATCH_SIZE = 50
+
+# Previews (mail_read with mark_read=False) are served from a small LRU for
+# a few seconds, so re-reading the same message doesn't cost a round-trip
+AGENT_MAIL_READ_CACHE_TTL = 10.0
+AGENT_MAIL_READ_CACHE_SIZE = 256
+
+# Retry policy (see _is_retryable_status). Writes carry an Idempotency-Key, but
+# a replayed write that hit a generic 500 may have partially applied, so only
+# retry writes on gateway/overload statuses. Idempotent reads are retried on
+# any 5xx. 4xx responses are never retried.
+_WRITE_METHODS = frozenset({"POST", "PUT"})
+_RETRYABLE_WRITE_STATUSES = frozenset({502, 503, 504})
+
+# Statuses a server answers a JSON-RPC batch with when it doesn't support one
+_BATCH_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 501})
+
+# Importance levels reported as "urgent" to callers
+_URGENT_IMPORTANCE = frozenset({"high", "urgent"})
+
+# Field projections for Agent Mail message records. Missing keys are filled
+# from the defaults so each record unpacks with a single C-level call.
+_INBOX_FIELDS = itemgetter(
+    "id", "thread_id", "from", "subject", "created_ts", "read_ts", "ack_required", "importance", "body_md"
+)
+_INBOX_DEFAULTS: dict[str, Any] = {
+    "id": None,
+    "thread_id": None,
+    "from": None,
+    "subject": None,
+    "created_ts": None,
+    "read_ts": None,
+    "ack_required": False,
+    "importance": None,
+    "body_md": None,
+}
+_MESSAGE_FIELDS = itemgetter(
+    "id", "thread_id", "from", "subject", "body_md",
+    "created_ts", "ack_required", "ack_ts", "read_ts", "importance",
+)
+_MESSAGE_DEFAULTS: dict[str, Any] = {
+    "id": None,
+    "thread_id": None,
+    "from": None,
+    "subject": None,
+    "body_md": "",
+    "created_ts": None,
+    "ack_required": False,
+    "ack_ts": None,
+    "read_ts": None,
+    "importance": None,
+}
+
+# Shared async HTTP clients so consecutive calls reuse keep-alive connections
+# instead of paying a TCP (and TLS) handshake per request. httpx connection
+# pools are bound to the event loop that created them, so there is one client
+# per loop: the MCP server's loop and the blocking wrappers' loop each keep
+# their own instead of rebuilding a client whenever calls alternate.
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Background event loop shared by the blocking mail_* wrappers
+_SYNC_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+# Fire-and-forget calls (mail_read's mark-read) still in flight, on any loop.
+# Holding a reference keeps them from being garbage collected mid-request.
+_BACKGROUND_TASKS: set[asyncio.Task[Any]] = set()
+
+# Whether the server accepts batched calls; None until the first batch is tried
+_BATCH_SUPPORTED: Optional[bool] = None
+
+# JSON-RPC request IDs
+_RPC_IDS = itertools.count(1)
+
+# Set to False once the server rejects or ignores fetch_inbox(unread_only)
+_UNREAD_FILTER_SUPPORTED: Optional[bool] = None
+
+# (project, agent, message_id) -> (expiry, formatted message), oldest first.
+# Locked because the MCP loop and the blocking wrappers' loop run on different threads.
+_READ_CACHE: OrderedDict[tuple[str, str, int], tuple[float, dict[str, Any]]] = OrderedDict()
+_READ_CACHE_LOCK = threading.Lock()
+
 
 class MailError(Exception):
-    """Base exception for Agent Mail errors."""
+    """Base exception for Agent Mail errors.
 
-    def __init__(self, code: str, message: str, data: Optional[dict] = None):
+    status is the HTTP status of the response that caused the error, or None
+    if there was no response (timeouts, connection failures, bad config).
+    """
+
+    def __init__(self, code: str, message: str, data: Optional[dict] = None, status: Optional[int] = None):
         self.code = code
         self.message = message
         self.data = data or {}
+        self.status = status
         super().__init__(message)
 
 
-def _get_config() -> tuple[str, str, Optional[str]]:
-    """Get Agent Mail configuration from environment.
+@functools.lru_cache(maxsize=1)
+def _get_mail_url() -> str:
+    """Get the Agent Mail base URL from BEADS_AGENT_MAIL_URL.
 
     Returns:
-        (base_url, agent_name, token)
+        Base URL with any trailing slash stripped (endpoints are absolute paths)
 
     Raises:
-        MailError: If required configuration is missing
+        MailError: If BEADS_AGENT_MAIL_URL is not set (not cached, so a later
+            call sees the variable once it is set and the cache is reset)
     """
     base_url = os.environ.get("BEADS_AGENT_MAIL_URL")
     if not base_url:
@@ -46,29 +186,268 @@ def _get_config() -> tuple[str, str, Optional[str]]:
             "See docs/AGENT_MAIL_QUICKSTART.md for setup instructions.",
         )
 
+    return base_url.rstrip("/")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_endpoint_url() -> str:
+    """Get the full URL of the MCP call endpoint that every tool call posts to.
+
+    Raises:
+        MailError: If BEADS_AGENT_MAIL_URL is not set
+    """
+    return _get_mail_url() + "/mcp/call"
+
+
+def _get_agent_name() -> str:
+    """Get the agent name from BEADS_AGENT_NAME, or derive one from user/repo.
+
+    Returns:
+        Agent name
+
+    Raises:
+        MailError: If the name is not set and cannot be derived
+    """
+    return _resolve_agent_name(os.getcwd(), os.environ.get("USER"))
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_agent_name(cwd: str, user: Optional[str]) -> str:
+    """Resolve the agent name for a working directory and $USER.
+
+    Cached per (cwd, user), like _resolve_project_key, so a derived name
+    follows the same directory as the project key it is sent with.
+
+    Args:
+        cwd: Current working directory (its basename names the repo)
+        user: Value of $USER, if set
+
+    Returns:
+        Agent name
+
+    Raises:
+        MailError: If the name is not set and cannot be derived
+    """
     agent_name = os.environ.get("BEADS_AGENT_NAME")
-    if not agent_name:
-        # Try to derive from user/repo
-        import getpass
+    if agent_name:
+        return agent_name
 
-        try:
-            user = getpass.getuser()
-            cwd = os.getcwd()
-            repo_name = os.path.basename(cwd)
-            agent_name = f"{user}-{repo_name}"
-            logger.warning(
-                f"BEADS_AGENT_NAME not set, using derived name: {agent_name}"
-            )
-        except Exception:
-            raise MailError(
-                "NOT_CONFIGURED",
-                "Agent Mail not configured. Set BEADS_AGENT_NAME environment variable.\n"
-                "Example: export BEADS_AGENT_NAME=my-agent",
-            )
+    # Try to derive from user/repo. Prefer the login env vars, which are
+    # free, over getpass.getuser() (pwd/NSS or registry lookups).
+    try:
+        user = user or os.environ.get("USERNAME") or getpass.getuser()
+        repo_name = os.path.basename(cwd)
+        agent_name = f"{user}-{repo_name}"
+        logger.warning(
+            f"BEADS_AGENT_NAME not set, using derived name: {agent_name}"
+        )
+    except Exception:
+        raise MailError(
+            "NOT_CONFIGURED",
+            "Agent Mail not configured. Set BEADS_AGENT_NAME environment variable.\n"
+            "Example: export BEADS_AGENT_NAME=my-agent",
+        )
+
+    return agent_name
+
+
+@functools.lru_cache(maxsize=1)
+def _get_token() -> Optional[str]:
+    """Get the optional Agent Mail bearer token from BEADS_AGENT_MAIL_TOKEN."""
+    return os.environ.get("BEADS_AGENT_MAIL_TOKEN")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_project_id() -> Optional[str]:
+    """Get the explicit project ID from BEADS_PROJECT_ID, if set."""
+    return os.environ.get("BEADS_PROJECT_ID") or None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_socket_path() -> Optional[str]:
+    """Get the Agent Mail UNIX socket path from BEADS_AGENT_MAIL_SOCKET, if usable.
+
+    The socket only stands in for a server on this machine, so it is ignored
+    (with a warning) unless BEADS_AGENT_MAIL_URL points at a loopback address.
+
+    Returns:
+        Socket path, or None if unset or the URL isn't loopback
+    """
+    socket_path = os.environ.get("BEADS_AGENT_MAIL_SOCKET") or None
+    if socket_path and not _is_loopback_url(_get_mail_url()):
+        logger.warning(
+            f"Ignoring BEADS_AGENT_MAIL_SOCKET={socket_path}: BEADS_AGENT_MAIL_URL "
+            f"{_get_mail_url()} is not a loopback address"
+        )
+        return None
+    return socket_path
+
+
+def _get_config() -> tuple[str, str, Optional[str]]:
+    """Get Agent Mail configuration from environment.
+
+    Each value is read once and cached for the life of the process (the
+    environment doesn't change between tool calls); use _reset_config_cache()
+    to re-read it. Missing configuration raises and is therefore never cached.
+
+    Returns:
+        (base_url, agent_name, token) with any trailing slash stripped from base_url
+
+    Raises:
+        MailError: If required configuration is missing
+    """
+    return _get_mail_url(), _get_agent_name(), _get_token()
+
+
+@functools.lru_cache(maxsize=1)
+def _http2_available() -> bool:
+    """Check whether the optional h2 package is installed (pip install 'beads-mcp[http2]').
 
-    token = os.environ.get("BEADS_AGENT_MAIL_TOKEN")
+    When it is, HTTPS connections negotiate HTTP/2 so concurrent requests such as
+    mail_read's fetch and mark-read are multiplexed over one connection. Checked
+    on first client creation rather than at import to keep module import cheap.
 
-    return base_url, agent_name, token
+    Returns:
+        True if httpx can use HTTP/2
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def _is_loopback_url(url: str) -> bool:
+    """Check whether a URL points at the local machine.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        True for localhost and loopback addresses (127.0.0.0/8, ::1)
+    """
+    host = urlparse(url).hostname or ""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Get the shared Agent Mail HTTP client for the running event loop.
+
+    Must be called from within a coroutine.
+
+    Returns:
+        AsyncClient with a pooled keep-alive transport and auth headers
+
+    Raises:
+        MailError: If required configuration is missing
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        # Static headers live on the client so requests only add per-call ones.
+        # Compression saves bytes on a real network but is pure CPU overhead on loopback.
+        base_url, _, token = _get_config()
+        headers = {
+            "Accept": "application/json",
+            "Connection": "keep-alive",
+            "Accept-Encoding": "identity" if _is_loopback_url(base_url) else "gzip",
+        }
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        # A co-located server can be reached over its UNIX socket, skipping TCP
+        # entirely; the URL still supplies the Host header and request paths
+        limits = httpx.Limits(max_keepalive_connections=16, max_connections=32)
+        transport = None
+        socket_path = _get_socket_path()
+        if socket_path:
+            transport = httpx.AsyncHTTPTransport(uds=socket_path, limits=limits)
+
+        client = _ASYNC_CLIENTS[loop] = httpx.AsyncClient(
+            headers=headers,
+            limits=limits,
+            timeout=AGENT_MAIL_TIMEOUT,
+            http2=_http2_available(),
+            transport=transport,
+        )
+
+    return client
+
+
+async def _aclose_client(client: httpx.AsyncClient) -> None:
+    """Close a client, logging rather than raising on failure."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.debug(f"Failed to close Agent Mail client: {e}")
+
+
+def _close_async_clients() -> None:
+    """Close and forget the shared clients, each on the loop it belongs to.
+
+    A client can only be closed from its own loop, so the close is scheduled
+    there without waiting for it. Clients whose loop is no longer running
+    can't be closed cleanly and are just dropped.
+    """
+    clients = list(_ASYNC_CLIENTS.items())
+    _ASYNC_CLIENTS.clear()
+
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    for loop, client in clients:
+        if loop is current:
+            _spawn_background(_aclose_client(client))
+        elif loop.is_running():
+            asyncio.run_coroutine_threadsafe(_aclose_client(client), loop)
+
+
+def _reset_config_cache() -> None:
+    """Forget cached configuration so the next call re-reads the environment."""
+    global _BATCH_SUPPORTED, _UNREAD_FILTER_SUPPORTED
+
+    _get_mail_url.cache_clear()
+    _get_endpoint_url.cache_clear()
+    _resolve_agent_name.cache_clear()
+    _get_token.cache_clear()
+    _get_project_id.cache_clear()
+    _get_socket_path.cache_clear()
+    _resolve_project_key.cache_clear()
+    # Clients carry the auth header and transport derived from config
+    _close_async_clients()
+    # Batch and filter support are properties of the configured server
+    _BATCH_SUPPORTED = None
+    _UNREAD_FILTER_SUPPORTED = None
+    with _READ_CACHE_LOCK:
+        _READ_CACHE.clear()
+
+
+def _reset_after_fork() -> None:
+    """Drop state inherited from the parent process.
+
+    Pooled sockets would be shared with the parent, and the background loop's
+    thread doesn't exist in the child, so both are recreated on next use. The
+    inherited clients are dropped without closing them, since a clean close
+    would also end the parent's connections. Locks are replaced rather than
+    acquired: another thread may have held one at fork time, and it would
+    never be released in the child. Configuration is re-read too, since a
+    child may adjust its environment.
+    """
+    global _ASYNC_CLIENTS, _READ_CACHE, _READ_CACHE_LOCK, _SYNC_LOOP, _SYNC_LOOP_LOCK, _BACKGROUND_TASKS
+
+    _ASYNC_CLIENTS = weakref.WeakKeyDictionary()
+    _READ_CACHE = OrderedDict()
+    _READ_CACHE_LOCK = threading.Lock()
+    _reset_config_cache()
+    _SYNC_LOOP = None
+    _SYNC_LOOP_LOCK = threading.Lock()
+    _BACKGROUND_TASKS = set()
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 def _get_project_key() -> str:
@@ -78,117 +457,204 @@ def _get_project_key() -> str:
         Project key (absolute path to workspace root)
     """
     # Check explicit project ID first
-    project_id = os.environ.get("BEADS_PROJECT_ID")
+    project_id = _get_project_id()
     if project_id:
         return project_id
 
+    return _resolve_project_key(os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_project_key(cwd: str) -> str:
+    """Derive project key from the workspace containing cwd.
+
+    Cached per directory so the filesystem walk runs once per workspace.
+
+    Args:
+        cwd: Directory to start the workspace search from
+
+    Returns:
+        Project key (absolute path to workspace root)
+    """
     # Try to get from bd workspace detection
     # Import here to avoid circular dependency
     from .tools import _find_beads_db_in_tree
 
-    workspace = _find_beads_db_in_tree()
+    workspace = _find_beads_db_in_tree(cwd)
     if workspace:
         return os.path.abspath(workspace)
 
     # Fallback to current directory
-    return os.path.abspath(os.getcwd())
+    return os.path.abspath(cwd)
+
+
+def _is_permanent_connect_error(error: BaseException) -> bool:
+    """Check whether a connection failure will not resolve by retrying.
+
+    A refused connection (nothing listening, e.g. Agent Mail not started), a
+    missing UNIX socket, or an unknown host name fails the same way on every attempt.
+
+    Args:
+        error: Exception raised while connecting
+
+    Returns:
+        True if the error chain contains a refused connection, missing socket, or unknown host
+    """
+    current: Optional[BaseException] = error
+    while current is not None:
+        if isinstance(current, (ConnectionRefusedError, FileNotFoundError)):
+            return True
+        if isinstance(current, socket.gaierror) and current.errno == socket.EAI_NONAME:
+            return True
+        if "Connection refused" in str(current):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def _is_retryable_status(method: str, status: int) -> bool:
+    """Check whether a 5xx response should be retried.
+
+    Args:
+        method: HTTP method of the failed request
+        status: Response status code (>= 500)
+
+    Returns:
+        True for any 5xx on reads, and only 502/503/504 on writes
+    """
+    return method not in _WRITE_METHODS or status in _RETRYABLE_WRITE_STATUSES
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Compute a randomized retry delay for the given attempt.
+
+    Args:
+        attempt: Zero-based attempt number that just failed
+
+    Returns:
+        Delay in seconds, capped at AGENT_MAIL_BACKOFF_MAX
+    """
+    ceiling = min(AGENT_MAIL_BACKOFF_MAX, AGENT_MAIL_BACKOFF_BASE * (2**attempt))
+    return random.uniform(AGENT_MAIL_BACKOFF_MIN, ceiling)
 
 
-def _call_agent_mail(
+async def _call_agent_mail(
     method: str,
     endpoint: str,
-    json_data: Optional[dict] = None,
+    json_data: Any = None,
     params: Optional[dict] = None,
-) -> dict[str, Any]:
+) -> Any:
     """Make HTTP request to Agent Mail server with retries.
 
     Args:
         method: HTTP method (GET, POST, DELETE, etc.)
         endpoint: API endpoint path (e.g., "/api/messages")
-        json_data: Request body as JSON
+        json_data: Request body as JSON (an object, or an array for batches)
         params: URL query parameters
 
     Returns:
-        Response JSON
+        Response JSON (an object, or an array for batches and message lists)
 
     Raises:
         MailError: On request failure or server error
     """
-    base_url, _, token = _get_config()
-    url = urljoin(base_url, endpoint)
+    # Tool calls all hit one endpoint, so its URL is built once
+    base_url = _get_mail_url()
+    url = _get_endpoint_url() if endpoint == "/mcp/call" else base_url + endpoint
 
     headers = {}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
 
-    # Use idempotency key for write operations to avoid duplicates on retry
-    if method in {"POST", "PUT"} and json_data:
-        import uuid
+    # Encode the body once; retries resend the same bytes
+    body = None
+    if json_data is not None:
+        body = _json_dumps(json_data)
+        headers["Content-Type"] = "application/json"
+
+    # Use idempotency key for write operations to avoid duplicates on retry.
+    # Generated once, outside the retry loop, so every attempt carries the same key.
+    if method in _WRITE_METHODS and json_data:
+        headers["Idempotency-Key"] = uuid.uuid4().hex
 
-        headers["Idempotency-Key"] = str(uuid.uuid4())
+    client = _get_async_client()
 
     last_error = None
     for attempt in range(AGENT_MAIL_RETRIES + 1):
         try:
-            response = requests.request(
-                method,
-                url,
-                json=json_data,
+            response = await client.request(
+                method=method,
+                url=url,
+                content=body,
                 params=params,
                 headers=headers,
-                timeout=AGENT_MAIL_TIMEOUT,
             )
 
-            # Success
-            if response.status_code < 400:
-                return response.json() if response.content else {}
+            status = response.status_code
+
+            # Success - fast path for the common case, skipping error classification
+            if status < 300:
+                if response.headers.get("Content-Length") == "0":
+                    return {}
+                return _json_loads(response.content) if response.content else {}
+
+            # Redirects aren't followed; treat as success like any other non-error
+            if status < 400:
+                return _json_loads(response.content) if response.content else {}
 
             # Client error - don't retry
-            if 400 <= response.status_code < 500:
+            if 400 <= status < 500:
                 error_data = {}
                 try:
-                    error_data = response.json()
+                    error_data = _json_loads(response.content)
                 except Exception:
                     error_data = {"detail": response.text}
 
-                if response.status_code == 404:
+                if status == 404:
                     raise MailError(
                         "NOT_FOUND",
                         f"Resource not found: {endpoint}",
                         error_data,
+                        status=status,
                     )
-                elif response.status_code == 409:
+                elif status == 409:
                     raise MailError(
                         "CONFLICT",
                         error_data.get("detail", "Conflict"),
                         error_data,
+                        status=status,
                     )
                 else:
                     raise MailError(
                         "INVALID_ARGUMENT",
-                        error_data.get("detail", f"HTTP {response.status_code}"),
+                        error_data.get("detail", f"HTTP {status}"),
                         error_data,
+                        status=status,
                     )
 
-            # Server error - retry
+            # Server error - retry if the policy allows it
             last_error = MailError(
                 "UNAVAILABLE",
-                f"Agent Mail server error: HTTP {response.status_code}",
-                {"status": response.status_code, "attempt": attempt + 1},
+                f"Agent Mail server error: HTTP {status}",
+                {"status": status, "attempt": attempt + 1},
+                status=status,
             )
+            if not _is_retryable_status(method, status):
+                raise last_error
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             last_error = MailError(
                 "TIMEOUT",
                 f"Agent Mail request timeout after {AGENT_MAIL_TIMEOUT}s",
                 {"attempt": attempt + 1},
             )
-        except requests.exceptions.ConnectionError as e:
+        except httpx.TransportError as e:
             last_error = MailError(
                 "UNAVAILABLE",
                 f"Cannot connect to Agent Mail server at {base_url}",
                 {"error": str(e), "attempt": attempt + 1},
             )
+            # Fail fast when the server isn't running or the host doesn't resolve
+            if isinstance(e, httpx.ConnectError) and _is_permanent_connect_error(e):
+                raise last_error from e
         except MailError:
             raise  # Re-raise our own errors
         except Exception as e:
@@ -198,204 +664,686 @@ def _call_agent_mail(
                 {"error": str(e), "attempt": attempt + 1},
             )
 
-        # Exponential backoff between retries
+        # Jittered exponential backoff between retries (without blocking the event loop)
         if attempt < AGENT_MAIL_RETRIES:
-            import time
-
-            time.sleep(0.5 * (2**attempt))
+            await asyncio.sleep(_backoff_delay(attempt))
 
     # All retries exhausted
     raise last_error
 
 
-def mail_send(
-    to: list[str],
-    subject: str,
-    body: str,
-    urgent: bool = False,
-    cc: Optional[list[str]] = None,
-    project_key: Optional[str] = None,
-    sender_name: Optional[str] = None,
-) -> dict[str, Any]:
-    """Send a message to other agents.
+async def _call_agent_mail_op(op: dict[str, Any]) -> Any:
+    """Issue a single MCP operation as its own HTTP request.
 
     Args:
-        to: List of recipient agent names
-        subject: Message subject
-        body: Message body (Markdown)
-        urgent: Mark as urgent (default: False)
-        cc: Optional CC recipients
-        project_key: Override project identifier (default: auto-detect)
-        sender_name: Override sender name (default: BEADS_AGENT_NAME)
+        op: {"method": "tools/call" | "resources/read", "params": {...}}
 
     Returns:
-        {
-            "message_id": int,
-            "thread_id": str,
-            "sent_to": int  # number of recipients
-        }
-
-    Raises:
-        MailError: On configuration or delivery error
+        Operation result
     """
-    _, auto_agent_name, _ = _get_config()
-    auto_project_key = _get_project_key()
+    if op["method"] == "resources/read":
+        return await _call_agent_mail("GET", f"/mcp/resources/{op['params']['uri']}")
+    return await _call_agent_mail("POST", "/mcp/call", json_data=op)
 
-    sender = sender_name or auto_agent_name
-    project = project_key or auto_project_key
 
-    importance = "urgent" if urgent else "normal"
+async def _gather_bounded(aws: Iterable[Awaitable[T]]) -> list[T]:
+    """Await several awaitables concurrently, at most AGENT_MAIL_CONCURRENCY at a time.
 
-    # Call Agent Mail send_message tool via HTTP
-    # Note: Agent Mail MCP tools use POST to /mcp/call endpoint
-    result = _call_agent_mail(
-        "POST",
-        "/mcp/call",
-        json_data={
-            "method": "tools/call",
-            "params": {
-                "name": "send_message",
-                "arguments": {
-                    "project_key": project,
-                    "sender_name": sender,
-                    "to": to,
-                    "subject": subject,
-                    "body_md": body,
-                    "cc": cc or [],
-                    "importance": importance,
-                },
-            },
-        },
-    )
+    Args:
+        aws: Awaitables to run
 
-    # Extract message details from result
-    # Agent Mail returns: {"deliveries": [...], "count": N}
-    deliveries = result.get("deliveries", [])
-    if not deliveries:
-        raise MailError("INTERNAL_ERROR", "No deliveries returned from Agent Mail")
+    Returns:
+        Their results, in order
+    """
+    semaphore = asyncio.Semaphore(AGENT_MAIL_CONCURRENCY)
 
-    # Get message ID from first delivery
-    first_delivery = deliveries[0]
-    payload = first_delivery.get("payload", {})
-    message_id = payload.get("id")
-    thread_id = payload.get("thread_id")
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
 
-    return {
-        "message_id": message_id,
-        "thread_id": thread_id,
-        "sent_to": len(deliveries),
-    }
+    return list(await asyncio.gather(*(run(aw) for aw in aws)))
 
 
-def mail_inbox(
-    limit: int = 20,
-    urgent_only: bool = False,
-    unread_only: bool = False,
-    cursor: Optional[str] = None,
-    agent_name: Optional[str] = None,
-    project_key: Optional[str] = None,
-) -> dict[str, Any]:
-    """Get messages from inbox.
+def _batch_result(response: Optional[dict[str, Any]]) -> Any:
+    """Unwrap one JSON-RPC response from a batch.
 
     Args:
-        limit: Maximum messages to return (default: 20)
-        urgent_only: Only return urgent messages
-        unread_only: Only return unread messages
-        cursor: Pagination cursor (for next page)
-        agent_name: Override agent name (default: BEADS_AGENT_NAME)
-        project_key: Override project (default: auto-detect)
+        response: Response object with the matching id, or None if the server sent none
 
     Returns:
-        {
-            "messages": [
-                {
-                    "id": int,
-                    "thread_id": str,
-                    "from": str,
-                    "subject": str,
-                    "created_ts": str,  # ISO-8601
-                    "unread": bool,
-                    "ack_required": bool,
-                    "urgent": bool,
-                    "preview": str  # first 100 chars
-                },
-                ...
-            ],
-            "next_cursor": str | None
-        }
+        The call's result, or a MailError for an error response or a missing one
     """
-    _, auto_agent_name, _ = _get_config()
-    auto_project_key = _get_project_key()
+    if response is None:
+        return MailError("INTERNAL_ERROR", "No response to batched call")
+    error = response.get("error")
+    if isinstance(error, dict):
+        code = error.get("code")
+        return MailError(
+            code if isinstance(code, str) else "INTERNAL_ERROR",
+            error.get("message", "Batched call failed"),
+            error,
+        )
+    return response.get("result", {})
 
-    agent = agent_name or auto_agent_name
-    project = project_key or auto_project_key
 
-    # Call fetch_inbox via MCP
-    result = _call_agent_mail(
-        "POST",
-        "/mcp/call",
-        json_data={
-            "method": "tools/call",
-            "params": {
-                "name": "fetch_inbox",
-                "arguments": {
-                    "project_key": project,
-                    "agent_name": agent,
-                    "limit": limit,
-                    "urgent_only": urgent_only,
-                    "include_bodies": False,  # Get preview only
-                },
-            },
-        },
-    )
+async def _send_batch(ops: list[dict[str, Any]]) -> Optional[list[Any]]:
+    """Send operations as one JSON-RPC batch, recording whether the server supports it.
 
-    # Agent Mail returns list of messages directly
-    messages = result if isinstance(result, list) else []
+    The operations go out as a JSON-RPC array and responses are matched to
+    them by id, so the server may answer in any order. Only an answer that
+    means "unsupported" (400/404/405/501, or a reply that isn't an array) is
+    remembered. A generic 500 falls back for this call only, and any other
+    failure, such as an overloaded server's 503, is raised rather than
+    multiplied into one request per operation.
 
-    # Transform to our format and filter unread if requested
-    formatted_messages = []
-    for msg in messages:
-        # Skip read messages if unread_only
-        if unread_only and msg.get("read_ts"):
-            continue
+    Args:
+        ops: JSON-RPC requests, as built by _rpc_request
 
-        formatted_messages.append(
-            {
-                "id": msg.get("id"),
-                "thread_id": msg.get("thread_id"),
-                "from": msg.get("from"),
-                "subject": msg.get("subject"),
-                "created_ts": msg.get("created_ts"),
-                "unread": not bool(msg.get("read_ts")),
-                "ack_required": msg.get("ack_required", False),
-                "urgent": msg.get("importance") in {"high", "urgent"},
-                "preview": msg.get("body_md", "")[:100] if msg.get("body_md") else "",
-            }
-        )
+    Returns:
+        One entry per operation (result or MailError), or None if the
+        operations should be sent individually
 
-    # Simple cursor pagination (use last message ID)
-    next_cursor = None
-    if formatted_messages and len(formatted_messages) >= limit:
-        next_cursor = str(formatted_messages[-1]["id"])
+    Raises:
+        MailError: On a timeout, connection failure, or other HTTP error
+    """
+    global _BATCH_SUPPORTED
 
-    return {"messages": formatted_messages, "next_cursor": next_cursor}
+    try:
+        responses = await _call_agent_mail("POST", "/mcp/call", json_data=ops)
+    except MailError as e:
+        if e.status == 500:
+            # May be an unknown method or a one-off failure; don't decide either way
+            logger.info("Agent Mail batch failed with HTTP 500, sending individually")
+            return None
+        if e.status not in _BATCH_UNSUPPORTED_STATUSES and e.code != "INTERNAL_ERROR":
+            raise
+        responses = None
 
+    if not isinstance(responses, list):
+        logger.info("Agent Mail server does not support batched calls, sending individually")
+        _BATCH_SUPPORTED = False
+        return None
 
-def mail_read(
-    message_id: int,
-    mark_read: bool = True,
-    agent_name: Optional[str] = None,
-    project_key: Optional[str] = None,
-) -> dict[str, Any]:
-    """Read full message with body.
+    _BATCH_SUPPORTED = True
+    by_id = {response.get("id"): response for response in responses if isinstance(response, dict)}
+    return [_batch_result(by_id.get(op["id"])) for op in ops]
 
-    Args:
-        message_id: Message ID to read
-        mark_read: Mark message as read (default: True)
-        agent_name: Override agent name (default: BEADS_AGENT_NAME)
-        project_key: Override project (default: auto-detect)
 
-    Returns:
+async def _call_agent_mail_batch(ops: list[dict[str, Any]]) -> list[Any]:
+    """Issue several MCP operations, AGENT_MAIL_BATCH_SIZE per HTTP round-trip.
+
+    If the server doesn't accept batches, the remaining operations are sent
+    as individual concurrent requests instead (see _send_batch for when that
+    is remembered for the rest of the process).
+
+    Args:
+        ops: JSON-RPC requests, as built by _rpc_request
+
+    Returns:
+        One entry per operation, in order: the result, or the MailError it failed with
+    """
+    results: list[Any] = []
+    sent = 0
+    while sent < len(ops) and _BATCH_SUPPORTED is not False:
+        batched = await _send_batch(ops[sent : sent + AGENT_MAIL_BATCH_SIZE])
+        if batched is None:
+            break
+        results.extend(batched)
+        sent += len(batched)
+
+    async def call_one(op: dict[str, Any]) -> Any:
+        try:
+            return await _call_agent_mail_op(op)
+        except MailError as e:
+            return e
+
+    if sent < len(ops):
+        results.extend(await _gather_bounded(call_one(op) for op in ops[sent:]))
+    return results
+
+
+def _format_message(result: dict[str, Any], message_id: int) -> dict[str, Any]:
+    """Convert a message resource into mail_read's result format.
+
+    Args:
+        result: Resource response, {"contents": [{...}]}
+        message_id: Requested message ID (for error messages)
+
+    Returns:
+        Formatted message (see async_mail_read)
+
+    Raises:
+        MailError: If the resource has no contents
+    """
+    contents = result.get("contents", [])
+    if not contents:
+        raise MailError("NOT_FOUND", f"Message {message_id} not found")
+
+    msg = contents[0]
+    id_, thread_id, sender, subject, body, created_ts, ack_required, ack_ts, read_ts, importance = (
+        _MESSAGE_FIELDS({**_MESSAGE_DEFAULTS, **msg})
+    )
+
+    return {
+        "id": id_,
+        "thread_id": thread_id,
+        "from": sender,
+        "to": msg.get("to", []),  # Not projected: each result needs its own list
+        "subject": subject,
+        "body": body,
+        "created_ts": created_ts,
+        "ack_required": ack_required,
+        "ack_status": bool(ack_ts),
+        "read_ts": read_ts,
+        "urgent": importance in _URGENT_IMPORTANCE,
+    }
+
+
+def _rpc_request(method: str, params: dict[str, Any]) -> dict[str, Any]:
+    """Build a JSON-RPC request envelope.
+
+    IDs only need to be unique within the process to correlate responses, so
+    they come from a counter rather than a UUID.
+
+    Args:
+        method: JSON-RPC method ("tools/call" or "resources/read")
+        params: Method parameters
+
+    Returns:
+        Request envelope
+    """
+    return {"jsonrpc": "2.0", "id": next(_RPC_IDS), "method": method, "params": params}
+
+
+def _tool_call(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Build a tools/call request for an Agent Mail MCP tool."""
+    return _rpc_request("tools/call", {"name": name, "arguments": arguments})
+
+
+def _read_op(message_id: int) -> dict[str, Any]:
+    """Build the resources/read operation for a message."""
+    return _rpc_request("resources/read", {"uri": f"resource://message/{message_id}"})
+
+
+def _mark_read_call(project: str, agent: str, message_id: int) -> dict[str, Any]:
+    """Build the mark_message_read tool call."""
+    return _tool_call(
+        "mark_message_read",
+        {"project_key": project, "agent_name": agent, "message_id": message_id},
+    )
+
+
+def _ack_call(project: str, agent: str, message_id: int) -> dict[str, Any]:
+    """Build the acknowledge_message tool call."""
+    return _tool_call(
+        "acknowledge_message",
+        {"project_key": project, "agent_name": agent, "message_id": message_id},
+    )
+
+
+def _reply_call(
+    project: str, sender: str, message_id: int, body: str, subject: Optional[str]
+) -> dict[str, Any]:
+    """Build the reply_message tool call."""
+    args = {
+        "project_key": project,
+        "message_id": message_id,
+        "sender_name": sender,
+        "body_md": body,
+    }
+
+    if subject:
+        args["subject_prefix"] = subject
+
+    return _tool_call("reply_message", args)
+
+
+async def warm_connection() -> None:
+    """Open a keep-alive connection to Agent Mail ahead of the first tool call.
+
+    Pays the TCP (and TLS) handshake at startup so the first user-facing mail
+    call lands on a warm connection. Best-effort: never raises.
+    """
+    try:
+        base_url, _, _ = _get_config()
+        await _get_async_client().request(method="HEAD", url=base_url + "/")
+    except Exception as e:
+        logger.debug(f"Agent Mail connection warm-up failed: {e}")
+
+
+def _encode_cursor(msg: dict[str, Any]) -> str:
+    """Build an opaque inbox cursor positioned after the given message.
+
+    Encodes the message's ID and creation timestamp (the keyset the server
+    orders by) without exposing them as a usable schema to callers.
+
+    Args:
+        msg: Last formatted message of the current page
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    key = _json_dumps({"id": msg["id"], "ts": msg["created_ts"]})
+    return base64.urlsafe_b64encode(key).decode("ascii")
+
+
+def _read_cache_get(key: tuple[str, str, int]) -> Optional[dict[str, Any]]:
+    """Get a cached message preview if it hasn't expired.
+
+    Args:
+        key: (project, agent, message_id)
+
+    Returns:
+        Copy of the cached message, or None
+    """
+    with _READ_CACHE_LOCK:
+        entry = _READ_CACHE.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _READ_CACHE[key]
+            return None
+        _READ_CACHE.move_to_end(key)
+        return dict(entry[1])
+
+
+def _read_cache_put(key: tuple[str, str, int], message: dict[str, Any]) -> None:
+    """Cache a message preview, evicting the least recently used entry when full.
+
+    Args:
+        key: (project, agent, message_id)
+        message: Formatted message
+    """
+    with _READ_CACHE_LOCK:
+        _READ_CACHE[key] = (time.monotonic() + AGENT_MAIL_READ_CACHE_TTL, dict(message))
+        _READ_CACHE.move_to_end(key)
+        if len(_READ_CACHE) > AGENT_MAIL_READ_CACHE_SIZE:
+            _READ_CACHE.popitem(last=False)
+
+
+def _read_cache_invalidate(message_id: int) -> None:
+    """Drop cached previews of a message after its state changes.
+
+    Args:
+        message_id: Message ID that was marked, acknowledged, replied to, or deleted
+    """
+    with _READ_CACHE_LOCK:
+        for key in [key for key in _READ_CACHE if key[2] == message_id]:
+            del _READ_CACHE[key]
+
+
+def _spawn_background(coro: Coroutine[Any, Any, Any]) -> None:
+    """Run a coroutine on the current loop without waiting for it.
+
+    Args:
+        coro: Coroutine that handles its own errors
+    """
+    task = asyncio.get_running_loop().create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+async def drain_background_tasks(timeout: float = AGENT_MAIL_TIMEOUT) -> None:
+    """Wait for fire-and-forget calls started on the running loop to finish.
+
+    Call before shutting the loop down so pending mark-read calls aren't lost.
+
+    Args:
+        timeout: Maximum seconds to wait
+    """
+    loop = asyncio.get_running_loop()
+    tasks = [task for task in list(_BACKGROUND_TASKS) if task.get_loop() is loop]
+    if tasks:
+        await asyncio.wait(tasks, timeout=timeout)
+
+
+async def _mark_message_read(project: str, agent: str, message_id: int) -> None:
+    """Mark a message as read, logging rather than raising on failure.
+
+    Args:
+        project: Project key
+        agent: Agent name the message was delivered to
+        message_id: Message ID to mark
+    """
+    try:
+        await _call_agent_mail(
+            "POST",
+            "/mcp/call",
+            json_data=_mark_read_call(project, agent, message_id),
+        )
+    except MailError as e:
+        # Don't fail read if mark fails
+        logger.warning(f"Failed to mark message {message_id} as read: {e}")
+    else:
+        _read_cache_invalidate(message_id)
+
+
+def _rejects_unread_filter(error: MailError) -> bool:
+    """Check whether a failed fetch_inbox call was rejecting the unread_only argument.
+
+    Only a validation error that names the argument counts; auth failures and
+    other client errors say nothing about what the server supports.
+
+    Args:
+        error: Error raised by the fetch_inbox call
+
+    Returns:
+        True for a 400/422 whose message or details mention unread_only
+    """
+    return error.status in {400, 422} and (
+        "unread_only" in error.message or "unread_only" in str(error.data)
+    )
+
+
+def _disable_unread_filter(reason: str) -> None:
+    """Stop asking the server to filter unread messages, warning the first time.
+
+    Args:
+        reason: How the server responded to unread_only ("rejected" or "ignored")
+    """
+    global _UNREAD_FILTER_SUPPORTED
+
+    if _UNREAD_FILTER_SUPPORTED is not False:
+        warnings.warn(
+            f"Agent Mail server {reason} fetch_inbox(unread_only); filtering unread messages client-side",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    _UNREAD_FILTER_SUPPORTED = False
+
+
+async def async_mail_send(
+    to: list[str],
+    subject: str,
+    body: str,
+    urgent: bool = False,
+    cc: Optional[list[str]] = None,
+    project_key: Optional[str] = None,
+    sender_name: Optional[str] = None,
+) -> dict[str, Any]:
+    """Send a message to other agents.
+
+    Args:
+        to: List of recipient agent names
+        subject: Message subject
+        body: Message body (Markdown)
+        urgent: Mark as urgent (default: False)
+        cc: Optional CC recipients
+        project_key: Override project identifier (default: auto-detect)
+        sender_name: Override sender name (default: BEADS_AGENT_NAME)
+
+    Returns:
+        {
+            "message_id": int,
+            "thread_id": str,
+            "sent_to": int  # number of recipients
+        }
+
+    Raises:
+        MailError: On configuration or delivery error
+    """
+    _, auto_agent_name, _ = _get_config()
+    auto_project_key = _get_project_key()
+
+    sender = sender_name or auto_agent_name
+    project = project_key or auto_project_key
+
+    importance = "urgent" if urgent else "normal"
+
+    # Call Agent Mail send_message tool via HTTP
+    # Note: Agent Mail MCP tools use POST to /mcp/call endpoint
+    result = await _call_agent_mail(
+        "POST",
+        "/mcp/call",
+        json_data=_tool_call(
+            "send_message",
+            {
+                "project_key": project,
+                "sender_name": sender,
+                "to": to,
+                "subject": subject,
+                "body_md": body,
+                "cc": cc or [],
+                "importance": importance,
+            },
+        ),
+    )
+
+    # Extract message details from result
+    # Agent Mail returns: {"deliveries": [...], "count": N}
+    deliveries = result.get("deliveries", [])
+    if not deliveries:
+        raise MailError("INTERNAL_ERROR", "No deliveries returned from Agent Mail")
+
+    # Get message ID from first delivery
+    first_delivery = deliveries[0]
+    payload = first_delivery.get("payload", {})
+    message_id = payload.get("id")
+    thread_id = payload.get("thread_id")
+
+    return {
+        "message_id": message_id,
+        "thread_id": thread_id,
+        "sent_to": len(deliveries),
+    }
+
+
+async def async_mail_inbox(
+    limit: int = 20,
+    urgent_only: bool = False,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Get messages from inbox.
+
+    Args:
+        limit: Maximum messages to return (default: 20)
+        urgent_only: Only return urgent messages
+        unread_only: Only return unread messages
+        cursor: Opaque next_cursor from a previous call (for next page)
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
+
+    Returns:
+        {
+            "messages": [
+                {
+                    "id": int,
+                    "thread_id": str,
+                    "from": str,
+                    "subject": str,
+                    "created_ts": str,  # ISO-8601
+                    "unread": bool,
+                    "ack_required": bool,
+                    "urgent": bool,
+                    "preview": str  # first 100 chars
+                },
+                ...
+            ],
+            "next_cursor": str | None
+        }
+    """
+    _, auto_agent_name, _ = _get_config()
+    auto_project_key = _get_project_key()
+
+    agent = agent_name or auto_agent_name
+    project = project_key or auto_project_key
+
+    # Let the server drop read messages unless it's known not to. Otherwise
+    # filter client-side, over-fetching to fill the page in one round-trip.
+    server_filter = unread_only and _UNREAD_FILTER_SUPPORTED is not False
+    fetch_limit = limit * 2 if unread_only and not server_filter else limit
+
+    arguments = {
+        "project_key": project,
+        "agent_name": agent,
+        "limit": fetch_limit,
+        "urgent_only": urgent_only,
+        "include_bodies": False,  # Get preview only
+    }
+    if server_filter:
+        arguments["unread_only"] = True
+    # Resume after the previous page so the server can seek instead of rescanning
+    if cursor:
+        arguments["cursor"] = cursor
+
+    # Call fetch_inbox via MCP
+    try:
+        result = await _call_agent_mail(
+            "POST",
+            "/mcp/call",
+            json_data=_tool_call("fetch_inbox", arguments),
+        )
+    except MailError as e:
+        if not server_filter or not _rejects_unread_filter(e):
+            raise
+        _disable_unread_filter("rejected")
+        return await async_mail_inbox(
+            limit=limit,
+            urgent_only=urgent_only,
+            unread_only=unread_only,
+            cursor=cursor,
+            agent_name=agent_name,
+            project_key=project_key,
+        )
+
+    # Agent Mail returns list of messages directly; a paginating server may
+    # instead return {"messages": [...], "next_cursor": <opaque token>}
+    server_cursor = None
+    if isinstance(result, dict):
+        messages = result.get("messages", [])
+        server_cursor = result.get("next_cursor")
+    else:
+        messages = result if isinstance(result, list) else []
+
+    # Skip read messages if unread_only, stopping as soon as we know whether the
+    # page overflows, so over-fetched records past it are never projected
+    matched = itertools.islice(
+        (msg for msg in messages if not (unread_only and msg.get("read_ts"))), limit + 1
+    )
+
+    # Transform to our format
+    matched_messages = [
+        {
+            "id": id_,
+            "thread_id": thread_id,
+            "from": sender,
+            "subject": subject,
+            "created_ts": created_ts,
+            "unread": not read_ts,
+            "ack_required": ack_required,
+            "urgent": importance in _URGENT_IMPORTANCE,
+            "preview": (body or "")[:100],
+        }
+        for id_, thread_id, sender, subject, created_ts, read_ts, ack_required, importance, body in (
+            _INBOX_FIELDS({**_INBOX_DEFAULTS, **msg}) for msg in matched
+        )
+    ]
+    formatted_messages = matched_messages[:limit]
+
+    # Below the cap every record was examined, so a shortfall means read ones came back
+    if server_filter and len(matched_messages) <= limit and len(matched_messages) < len(messages):
+        _disable_unread_filter("ignored")
+
+    # Keyset pagination: resume after the last returned message if we trimmed
+    # over-fetched ones the next page must still include; otherwise, if the
+    # server filled the page, prefer its token and fall back to the last record
+    next_cursor = None
+    if len(matched_messages) > limit:
+        next_cursor = _encode_cursor(formatted_messages[-1])
+    elif messages and len(messages) >= fetch_limit:
+        next_cursor = server_cursor or _encode_cursor({**_INBOX_DEFAULTS, **messages[-1]})
+
+    return {"messages": formatted_messages, "next_cursor": next_cursor}
+
+
+async def async_mail_inbox_iter(
+    limit: int = 20,
+    urgent_only: bool = False,
+    unread_only: bool = False,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Iterate over every inbox message, page by page.
+
+    The next page is requested as soon as the current one arrives, so its
+    round-trip overlaps with the caller processing the current page.
+    Iteration stops early if the server ignores the cursor, i.e. returns the
+    same cursor or the same page again.
+
+    Args:
+        limit: Page size (default: 20)
+        urgent_only: Only return urgent messages
+        unread_only: Only return unread messages
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
+
+    Yields:
+        Messages in the same format as mail_inbox
+    """
+
+    def fetch_page(cursor: Optional[str]) -> Coroutine[Any, Any, dict[str, Any]]:
+        return async_mail_inbox(
+            limit=limit,
+            urgent_only=urgent_only,
+            unread_only=unread_only,
+            cursor=cursor,
+            agent_name=agent_name,
+            project_key=project_key,
+        )
+
+    cursor = None
+    page = await fetch_page(cursor)
+    while True:
+        # A server that ignores the cursor hands back the same page (and so
+        # the same cursor) every time; stop rather than loop over it forever
+        next_page = None
+        if page["next_cursor"] and page["next_cursor"] != cursor:
+            next_page = asyncio.create_task(fetch_page(page["next_cursor"]))
+        elif page["next_cursor"]:
+            logger.warning("Agent Mail server ignored the inbox cursor, stopping iteration")
+
+        try:
+            for msg in page["messages"]:
+                yield msg
+        except BaseException:
+            # Caller stopped early (aclose/cancel) - abandon the prefetch
+            if next_page is not None:
+                next_page.cancel()
+            raise
+
+        if next_page is None:
+            return
+        first_id = page["messages"][0]["id"] if page["messages"] else None
+        cursor = page["next_cursor"]
+        page = await next_page
+        if page["messages"] and page["messages"][0]["id"] == first_id:
+            logger.warning("Agent Mail server ignored the inbox cursor, stopping iteration")
+            return
+
+
+async def async_mail_read(
+    message_id: int,
+    mark_read: bool = True,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Read full message with body.
+
+    When mark_read is set, the mark-read call is sent in the background once
+    the fetch has succeeded, and the result is returned without waiting for
+    it (a failed mark is only logged). Otherwise the message may be served from a short-lived
+    cache of recent previews.
+
+    Args:
+        message_id: Message ID to read
+        mark_read: Mark message as read (default: True)
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
+
+    Returns:
         {
             "id": int,
             "thread_id": str,
@@ -416,57 +1364,96 @@ def mail_read(
     agent = agent_name or auto_agent_name
     project = project_key or auto_project_key
 
+    cache_key = (project, agent, message_id)
+    if not mark_read:
+        cached = _read_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
     # Get message via resource
-    result = _call_agent_mail(
-        "GET", f"/mcp/resources/resource://message/{message_id}"
-    )
+    # Resource returns: {"contents": [{...}]}
+    result = await _call_agent_mail("GET", f"/mcp/resources/resource://message/{message_id}")
+    message = _format_message(result, message_id)
 
-    # Mark as read if requested
+    # Only a message that was actually fetched is marked read; the response
+    # doesn't wait for the mark-read call
     if mark_read:
-        try:
-            _call_agent_mail(
-                "POST",
-                "/mcp/call",
-                json_data={
-                    "method": "tools/call",
-                    "params": {
-                        "name": "mark_message_read",
-                        "arguments": {
-                            "project_key": project,
-                            "agent_name": agent,
-                            "message_id": message_id,
-                        },
-                    },
-                },
-            )
-        except MailError as e:
-            # Don't fail read if mark fails
-            logger.warning(f"Failed to mark message {message_id} as read: {e}")
+        _spawn_background(_mark_message_read(project, agent, message_id))
+    else:
+        _read_cache_put(cache_key, message)
+    return message
 
-    # Extract message from result
-    # Resource returns: {"contents": [{...}]}
-    contents = result.get("contents", [])
-    if not contents:
-        raise MailError("NOT_FOUND", f"Message {message_id} not found")
 
-    msg = contents[0]
+async def async_mail_read_many(
+    message_ids: list[int],
+    mark_read: bool = True,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Read several messages, batching the fetches (and mark-read calls).
 
-    return {
-        "id": msg.get("id"),
-        "thread_id": msg.get("thread_id"),
-        "from": msg.get("from"),
-        "to": msg.get("to", []),
-        "subject": msg.get("subject"),
-        "body": msg.get("body_md", ""),
-        "created_ts": msg.get("created_ts"),
-        "ack_required": msg.get("ack_required", False),
-        "ack_status": bool(msg.get("ack_ts")),
-        "read_ts": msg.get("read_ts"),
-        "urgent": msg.get("importance") in {"high", "urgent"},
-    }
+    Uses batched requests when the server supports them, otherwise concurrent
+    individual requests. A failed read doesn't abort the others; it is
+    reported in place as an error entry. The mark-read calls go out as a
+    second batch once the reads are back, and only for messages that were
+    fetched. With mark_read=False, recently
+    previewed messages are served from the read cache.
+
+    Args:
+        message_ids: Message IDs to read
+        mark_read: Mark messages as read (default: True)
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
 
+    Returns:
+        One entry per ID, in order: the message as returned by mail_read, or
+        {"id": int, "error": str, "message": str, "data": dict} on failure
+    """
+    _, auto_agent_name, _ = _get_config()
+    auto_project_key = _get_project_key()
 
-def mail_reply(
+    agent = agent_name or auto_agent_name
+    project = project_key or auto_project_key
+
+    results: dict[int, dict[str, Any]] = {}
+    if not mark_read:
+        for message_id in message_ids:
+            cached = _read_cache_get((project, agent, message_id))
+            if cached is not None:
+                results[message_id] = cached
+    pending = [message_id for message_id in dict.fromkeys(message_ids) if message_id not in results]
+
+    outcomes = await _call_agent_mail_batch([_read_op(message_id) for message_id in pending])
+
+    fetched = []
+    for message_id, outcome in zip(pending, outcomes, strict=True):
+        try:
+            if isinstance(outcome, MailError):
+                raise outcome
+            results[message_id] = _format_message(outcome, message_id)
+        except MailError as e:
+            results[message_id] = {"id": message_id, "error": e.code, "message": e.message, "data": e.data}
+        else:
+            fetched.append(message_id)
+            if not mark_read:
+                _read_cache_put((project, agent, message_id), results[message_id])
+
+    # Only messages that were actually fetched are marked read, as a second batch
+    if mark_read and fetched:
+        mark_outcomes = await _call_agent_mail_batch(
+            [_mark_read_call(project, agent, message_id) for message_id in fetched]
+        )
+        for message_id, mark_outcome in zip(fetched, mark_outcomes, strict=True):
+            if isinstance(mark_outcome, MailError):
+                # Don't fail read if mark fails
+                logger.warning(f"Failed to mark message {message_id} as read: {mark_outcome}")
+            else:
+                _read_cache_invalidate(message_id)
+
+    return [results[message_id] for message_id in message_ids]
+
+
+async def async_mail_reply(
     message_id: int,
     body: str,
     subject: Optional[str] = None,
@@ -495,24 +1482,12 @@ def mail_reply(
     project = project_key or auto_project_key
 
     # Call reply_message via MCP
-    args = {
-        "project_key": project,
-        "message_id": message_id,
-        "sender_name": sender,
-        "body_md": body,
-    }
-
-    if subject:
-        args["subject_prefix"] = subject
-
-    result = _call_agent_mail(
+    result = await _call_agent_mail(
         "POST",
         "/mcp/call",
-        json_data={
-            "method": "tools/call",
-            "params": {"name": "reply_message", "arguments": args},
-        },
+        json_data=_reply_call(project, sender, message_id, body, subject),
     )
+    _read_cache_invalidate(message_id)
 
     # Extract reply details
     reply = result.get("reply", {})
@@ -522,7 +1497,69 @@ def mail_reply(
     }
 
 
-def mail_ack(
+async def async_mail_read_and_reply(
+    message_id: int,
+    body: str,
+    subject: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Read a message, mark it read, and reply to it.
+
+    The message is fetched first. Only once it has been read are the
+    mark-read and reply calls sent, batched together when the server
+    supports it, so a failed read never leaves behind a reply the caller
+    doesn't know about or marks a message nobody saw.
+
+    Args:
+        message_id: Message ID to read and reply to
+        body: Reply body (Markdown)
+        subject: Override subject (default: "Re: <original subject>")
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
+
+    Returns:
+        {
+            "message": {...},  # as returned by mail_read
+            "reply": {"message_id": int, "thread_id": str}
+        }
+
+    Raises:
+        MailError: If the read or the reply fails
+    """
+    _, auto_agent_name, _ = _get_config()
+    auto_project_key = _get_project_key()
+
+    agent = agent_name or auto_agent_name
+    project = project_key or auto_project_key
+
+    message = _format_message(await _call_agent_mail_op(_read_op(message_id)), message_id)
+
+    mark_result, reply_result = await _call_agent_mail_batch(
+        [
+            _mark_read_call(project, agent, message_id),
+            _reply_call(project, agent, message_id, body, subject),
+        ]
+    )
+    _read_cache_invalidate(message_id)
+
+    if isinstance(mark_result, MailError):
+        # Don't fail read if mark fails
+        logger.warning(f"Failed to mark message {message_id} as read: {mark_result}")
+    if isinstance(reply_result, MailError):
+        raise reply_result
+
+    reply = reply_result.get("reply", {})
+    return {
+        "message": message,
+        "reply": {
+            "message_id": reply.get("id"),
+            "thread_id": reply.get("thread_id"),
+        },
+    }
+
+
+async def async_mail_ack(
     message_id: int,
     agent_name: Optional[str] = None,
     project_key: Optional[str] = None,
@@ -544,26 +1581,17 @@ def mail_ack(
     project = project_key or auto_project_key
 
     # Call acknowledge_message via MCP
-    _call_agent_mail(
+    await _call_agent_mail(
         "POST",
         "/mcp/call",
-        json_data={
-            "method": "tools/call",
-            "params": {
-                "name": "acknowledge_message",
-                "arguments": {
-                    "project_key": project,
-                    "agent_name": agent,
-                    "message_id": message_id,
-                },
-            },
-        },
+        json_data=_ack_call(project, agent, message_id),
     )
+    _read_cache_invalidate(message_id)
 
     return {"acknowledged": True}
 
 
-def mail_delete(
+async def async_mail_delete(
     message_id: int,
     agent_name: Optional[str] = None,
     project_key: Optional[str] = None,
@@ -589,23 +1617,323 @@ def mail_delete(
     # Agent Mail doesn't have explicit delete in MCP API
     # Best we can do is mark as read and acknowledged
     # (This prevents it from showing in urgent/unread views)
-    try:
-        _call_agent_mail(
+    # Soft failure - message may not exist or already read
+    with contextlib.suppress(MailError):
+        await _call_agent_mail(
             "POST",
             "/mcp/call",
-            json_data={
-                "method": "tools/call",
-                "params": {
-                    "name": "mark_message_read",
-                    "arguments": {
-                        "project_key": project,
-                        "agent_name": agent,
-                        "message_id": message_id,
-                    },
-                },
-            },
+            json_data=_mark_read_call(project, agent, message_id),
+        )
+    _read_cache_invalidate(message_id)
+    return {"archived": True}
+
+
+async def async_mail_ack_many(
+    message_ids: list[int],
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Acknowledge several messages, batching the calls when the server supports it.
+
+    Args:
+        message_ids: Message IDs to acknowledge
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
+
+    Returns:
+        One entry per ID, in order: {"id": int, "acknowledged": True}, or
+        {"id": int, "acknowledged": False, "error": str, "message": str} on failure
+    """
+    _, auto_agent_name, _ = _get_config()
+    auto_project_key = _get_project_key()
+
+    agent = agent_name or auto_agent_name
+    project = project_key or auto_project_key
+
+    outcomes = await _call_agent_mail_batch(
+        [_ack_call(project, agent, message_id) for message_id in message_ids]
+    )
+
+    results = []
+    for message_id, outcome in zip(message_ids, outcomes, strict=True):
+        _read_cache_invalidate(message_id)
+        if isinstance(outcome, MailError):
+            results.append(
+                {"id": message_id, "acknowledged": False, "error": outcome.code, "message": outcome.message}
+            )
+        else:
+            results.append({"id": message_id, "acknowledged": True})
+    return results
+
+
+async def async_mail_delete_many(
+    message_ids: list[int],
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Delete (archive) several messages, batching the calls when the server supports it.
+
+    Like mail_delete, this marks each message as read and treats every
+    failure as soft, whether a single call fails (the message may not exist
+    or may already be read) or the whole request does.
+
+    Args:
+        message_ids: Message IDs to delete
+        agent_name: Override agent name (default: BEADS_AGENT_NAME)
+        project_key: Override project (default: auto-detect)
+
+    Returns:
+        One entry per ID, in order: {"id": int, "archived": True}
+    """
+    _, auto_agent_name, _ = _get_config()
+    auto_project_key = _get_project_key()
+
+    agent = agent_name or auto_agent_name
+    project = project_key or auto_project_key
+
+    # Soft failure, including a timeout or lost connection on the batch itself
+    with contextlib.suppress(MailError):
+        await _call_agent_mail_batch(
+            [_mark_read_call(project, agent, message_id) for message_id in message_ids]
+        )
+
+    for message_id in message_ids:
+        _read_cache_invalidate(message_id)
+    return [{"id": message_id, "archived": True} for message_id in message_ids]
+
+
+# Blocking wrappers for synchronous callers. They all run on one long-lived
+# background event loop, so the shared client and its keep-alive connections
+# survive between calls instead of being rebuilt by asyncio.run() each time.
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop used by the blocking wrappers, starting it if needed.
+
+    Returns:
+        Event loop running forever on a daemon thread
+    """
+    global _SYNC_LOOP
+
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="beads-mcp-mail", daemon=True).start()
+            _SYNC_LOOP = loop
+    return _SYNC_LOOP
+
+
+def _drain_sync_loop() -> None:
+    """Let background calls on the blocking wrappers' loop finish at interpreter exit."""
+    loop = _SYNC_LOOP
+    if loop is None or loop.is_closed() or not _BACKGROUND_TASKS:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(drain_background_tasks(), loop).result()
+    except Exception as e:
+        logger.debug(f"Failed to drain Agent Mail background calls: {e}")
+
+
+atexit.register(_drain_sync_loop)
+
+
+def _run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and wait for its result.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result (exceptions propagate unchanged)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_sync_loop()).result()
+
+
+def mail_send(
+    to: list[str],
+    subject: str,
+    body: str,
+    urgent: bool = False,
+    cc: Optional[list[str]] = None,
+    project_key: Optional[str] = None,
+    sender_name: Optional[str] = None,
+) -> dict[str, Any]:
+    """Send a message to other agents. Blocking wrapper for async_mail_send."""
+    return _run_sync(
+        async_mail_send(
+            to=to,
+            subject=subject,
+            body=body,
+            urgent=urgent,
+            cc=cc,
+            project_key=project_key,
+            sender_name=sender_name,
+        )
+    )
+
+
+def mail_inbox(
+    limit: int = 20,
+    urgent_only: bool = False,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Get messages from inbox. Blocking wrapper for async_mail_inbox."""
+    return _run_sync(
+        async_mail_inbox(
+            limit=limit,
+            urgent_only=urgent_only,
+            unread_only=unread_only,
+            cursor=cursor,
+            agent_name=agent_name,
+            project_key=project_key,
+        )
+    )
+
+
+def mail_inbox_iter(
+    limit: int = 20,
+    urgent_only: bool = False,
+    unread_only: bool = False,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """Iterate over every inbox message. Blocking wrapper for async_mail_inbox_iter."""
+    pages = async_mail_inbox_iter(
+        limit=limit,
+        urgent_only=urgent_only,
+        unread_only=unread_only,
+        agent_name=agent_name,
+        project_key=project_key,
+    )
+
+    async def next_message() -> dict[str, Any]:
+        return await pages.__anext__()
+
+    try:
+        while True:
+            try:
+                msg = _run_sync(next_message())
+            except StopAsyncIteration:
+                return
+            yield msg
+    finally:
+        _run_sync(pages.aclose())
+
+
+def mail_read(
+    message_id: int,
+    mark_read: bool = True,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Read full message with body. Blocking wrapper for async_mail_read."""
+    return _run_sync(
+        async_mail_read(
+            message_id=message_id,
+            mark_read=mark_read,
+            agent_name=agent_name,
+            project_key=project_key,
+        )
+    )
+
+
+def mail_read_many(
+    message_ids: list[int],
+    mark_read: bool = True,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Read several messages concurrently. Blocking wrapper for async_mail_read_many."""
+    return _run_sync(
+        async_mail_read_many(
+            message_ids=message_ids,
+            mark_read=mark_read,
+            agent_name=agent_name,
+            project_key=project_key,
+        )
+    )
+
+
+def mail_reply(
+    message_id: int,
+    body: str,
+    subject: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Reply to a message (preserves thread). Blocking wrapper for async_mail_reply."""
+    return _run_sync(
+        async_mail_reply(
+            message_id=message_id,
+            body=body,
+            subject=subject,
+            agent_name=agent_name,
+            project_key=project_key,
+        )
+    )
+
+
+def mail_read_and_reply(
+    message_id: int,
+    body: str,
+    subject: Optional[str] = None,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, Any]:
+    """Read, mark read, and reply in one round-trip. Blocking wrapper for async_mail_read_and_reply."""
+    return _run_sync(
+        async_mail_read_and_reply(
+            message_id=message_id,
+            body=body,
+            subject=subject,
+            agent_name=agent_name,
+            project_key=project_key,
         )
-        return {"archived": True}
-    except MailError:
-        # Soft failure - message may not exist or already read
-        return {"archived": True}
+    )
+
+
+def mail_ack(
+    message_id: int,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, bool]:
+    """Acknowledge a message. Blocking wrapper for async_mail_ack."""
+    return _run_sync(
+        async_mail_ack(message_id=message_id, agent_name=agent_name, project_key=project_key)
+    )
+
+
+def mail_delete(
+    message_id: int,
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> dict[str, bool]:
+    """Delete (archive) a message from inbox. Blocking wrapper for async_mail_delete."""
+    return _run_sync(
+        async_mail_delete(message_id=message_id, agent_name=agent_name, project_key=project_key)
+    )
+
+
+def mail_ack_many(
+    message_ids: list[int],
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Acknowledge several messages. Blocking wrapper for async_mail_ack_many."""
+    return _run_sync(
+        async_mail_ack_many(message_ids=message_ids, agent_name=agent_name, project_key=project_key)
+    )
+
+
+def mail_delete_many(
+    message_ids: list[int],
+    agent_name: Optional[str] = None,
+    project_key: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Delete (archive) several messages. Blocking wrapper for async_mail_delete_many."""
+    return _run_sync(
+        async_mail_delete_many(message_ids=message_ids, agent_name=agent_name, project_key=project_key)
+    )
@@ -5,17 +5,23 @@ from typing import Annotated, Any
 
 from .mail import (
     MailError,
-    mail_ack,
-    mail_delete,
-    mail_inbox,
-    mail_read,
-    mail_reply,
-    mail_send,
+    async_mail_ack,
+    async_mail_ack_many,
+    async_mail_delete,
+    async_mail_delete_many,
+    async_mail_inbox,
+    async_mail_read,
+    async_mail_read_many,
+    async_mail_reply,
+    async_mail_send,
 )
 from .models import (
+    MailAckManyParams,
     MailAckParams,
+    MailDeleteManyParams,
     MailDeleteParams,
     MailInboxParams,
+    MailReadManyParams,
     MailReadParams,
     MailReplyParams,
     MailSendParams,
@@ -24,7 +30,7 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 
-def beads_mail_send(params: MailSendParams) -> dict[str, Any]:
+async def beads_mail_send(params: MailSendParams) -> dict[str, Any]:
     """Send a message to other agents via Agent Mail.
 
     Requires BEADS_AGENT_MAIL_URL and BEADS_AGENT_NAME environment variables.
@@ -43,7 +49,7 @@ def beads_mail_send(params: MailSendParams) -> dict[str, Any]:
         MailError: On configuration or delivery error
     """
     try:
-        return mail_send(
+        return await async_mail_send(
             to=params.to,
             subject=params.subject,
             body=params.body,
@@ -57,7 +63,7 @@ def beads_mail_send(params: MailSendParams) -> dict[str, Any]:
         return {"error": e.code, "message": e.message, "data": e.data}
 
 
-def beads_mail_inbox(
+async def beads_mail_inbox(
     params: Annotated[MailInboxParams, "Parameters"] = MailInboxParams(),
 ) -> dict[str, Any]:
     """Get messages from Agent Mail inbox.
@@ -80,7 +86,7 @@ def beads_mail_inbox(
         MailError: On configuration or fetch error
     """
     try:
-        return mail_inbox(
+        return await async_mail_inbox(
             limit=params.limit,
             urgent_only=params.urgent_only,
             unread_only=params.unread_only,
@@ -93,7 +99,7 @@ def beads_mail_inbox(
         return {"error": e.code, "message": e.message, "data": e.data}
 
 
-def beads_mail_read(params: MailReadParams) -> dict[str, Any]:
+async def beads_mail_read(params: MailReadParams) -> dict[str, Any]:
     """Read full message with body from Agent Mail.
 
     By default, marks the message as read. Set mark_read=False to preview without marking.
@@ -114,7 +120,7 @@ def beads_mail_read(params: MailReadParams) -> dict[str, Any]:
         MailError: On configuration or read error
     """
     try:
-        return mail_read(
+        return await async_mail_read(
             message_id=params.message_id,
             mark_read=params.mark_read,
             agent_name=params.agent_name,
@@ -125,7 +131,38 @@ def beads_mail_read(params: MailReadParams) -> dict[str, Any]:
         return {"error": e.code, "message": e.message, "data": e.data}
 
 
-def beads_mail_reply(params: MailReplyParams) -> dict[str, Any]:
+async def beads_mail_read_many(params: MailReadManyParams) -> dict[str, Any]:
+    """Read several messages from Agent Mail concurrently.
+
+    Faster than calling mail_read once per message. A message that fails to
+    load is reported in place rather than failing the whole call.
+
+    Example:
+        mail_read_many(message_ids=[123, 124, 125])
+
+    Args:
+        params: Read parameters (message_ids, mark_read)
+
+    Returns:
+        {messages: [{id, thread_id, from, ...} | {id, error, message, data}, ...]}
+
+    Raises:
+        MailError: On configuration error
+    """
+    try:
+        messages = await async_mail_read_many(
+            message_ids=params.message_ids,
+            mark_read=params.mark_read,
+            agent_name=params.agent_name,
+            project_key=params.project_key,
+        )
+    except MailError as e:
+        logger.error(f"mail_read_many failed: {e.message}")
+        return {"error": e.code, "message": e.message, "data": e.data}
+    return {"messages": messages}
+
+
+async def beads_mail_reply(params: MailReplyParams) -> dict[str, Any]:
     """Reply to a message (preserves thread).
 
     Automatically inherits thread_id from the original message.
@@ -143,7 +180,7 @@ def beads_mail_reply(params: MailReplyParams) -> dict[str, Any]:
         MailError: On configuration or reply error
     """
     try:
-        return mail_reply(
+        return await async_mail_reply(
             message_id=params.message_id,
             body=params.body,
             subject=params.subject,
@@ -155,7 +192,7 @@ def beads_mail_reply(params: MailReplyParams) -> dict[str, Any]:
         return {"error": e.code, "message": e.message, "data": e.data}
 
 
-def beads_mail_ack(params: MailAckParams) -> dict[str, bool]:
+async def beads_mail_ack(params: MailAckParams) -> dict[str, bool]:
     """Acknowledge a message (for ack_required messages).
 
     Safe to call even if message doesn't require acknowledgement.
@@ -173,7 +210,7 @@ def beads_mail_ack(params: MailAckParams) -> dict[str, bool]:
         MailError: On configuration or ack error
     """
     try:
-        return mail_ack(
+        return await async_mail_ack(
             message_id=params.message_id,
             agent_name=params.agent_name,
             project_key=params.project_key,
@@ -183,7 +220,37 @@ def beads_mail_ack(params: MailAckParams) -> dict[str, bool]:
         return {"error": e.code, "acknowledged": False, "message": e.message}
 
 
-def beads_mail_delete(params: MailDeleteParams) -> dict[str, bool]:
+async def beads_mail_ack_many(params: MailAckManyParams) -> dict[str, Any]:
+    """Acknowledge several messages at once.
+
+    Sends the acknowledgements in a single batched request when the server
+    supports it. A failed acknowledgement is reported in place.
+
+    Example:
+        mail_ack_many(message_ids=[123, 124])
+
+    Args:
+        params: Acknowledgement parameters (message_ids)
+
+    Returns:
+        {results: [{id, acknowledged: True} | {id, acknowledged: False, error, message}, ...]}
+
+    Raises:
+        MailError: On configuration error
+    """
+    try:
+        results = await async_mail_ack_many(
+            message_ids=params.message_ids,
+            agent_name=params.agent_name,
+            project_key=params.project_key,
+        )
+    except MailError as e:
+        logger.error(f"mail_ack_many failed: {e.message}")
+        return {"error": e.code, "message": e.message, "data": e.data}
+    return {"results": results}
+
+
+async def beads_mail_delete(params: MailDeleteParams) -> dict[str, bool]:
     """Delete (archive) a message from Agent Mail inbox.
 
     Note: Agent Mail archives messages rather than permanently deleting them.
@@ -201,7 +268,7 @@ def beads_mail_delete(params: MailDeleteParams) -> dict[str, bool]:
         MailError: On configuration or delete error
     """
     try:
-        return mail_delete(
+        return await async_mail_delete(
             message_id=params.message_id,
             agent_name=params.agent_name,
             project_key=params.project_key,
@@ -209,3 +276,32 @@ def beads_mail_delete(params: MailDeleteParams) -> dict[str, bool]:
     except MailError as e:
         logger.error(f"mail_delete failed: {e.message}")
         return {"error": e.code, "deleted": False, "message": e.message}
+
+
+async def beads_mail_delete_many(params: MailDeleteManyParams) -> dict[str, Any]:
+    """Delete (archive) several messages from Agent Mail inbox at once.
+
+    Sends the calls in a single batched request when the server supports it.
+
+    Example:
+        mail_delete_many(message_ids=[123, 124])
+
+    Args:
+        params: Delete parameters (message_ids)
+
+    Returns:
+        {results: [{id, archived: True}, ...]}
+
+    Raises:
+        MailError: On configuration or delete error
+    """
+    try:
+        results = await async_mail_delete_many(
+            message_ids=params.message_ids,
+            agent_name=params.agent_name,
+            project_key=params.project_key,
+        )
+    except MailError as e:
+        logger.error(f"mail_delete_many failed: {e.message}")
+        return {"error": e.code, "message": e.message, "data": e.data}
+    return {"results": results}
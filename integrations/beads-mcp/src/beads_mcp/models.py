@@ -159,3 +159,86 @@ class InitResult(BaseModel):
     database: str
     prefix: str
     message: str
+
+
+class MailSendParams(BaseModel):
+    """Parameters for sending an Agent Mail message."""
+
+    to: list[str]
+    subject: str
+    body: str
+    urgent: bool = False
+    cc: list[str] | None = None
+    project_key: str | None = None
+    sender_name: str | None = None
+
+
+class MailInboxParams(BaseModel):
+    """Parameters for fetching the Agent Mail inbox."""
+
+    limit: int = Field(default=20, ge=1, le=100)
+    urgent_only: bool = False
+    unread_only: bool = False
+    cursor: str | None = None
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailReadParams(BaseModel):
+    """Parameters for reading an Agent Mail message."""
+
+    message_id: int
+    mark_read: bool = True
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailReadManyParams(BaseModel):
+    """Parameters for reading several Agent Mail messages at once."""
+
+    message_ids: list[int] = Field(min_length=1, max_length=100)
+    mark_read: bool = True
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailReplyParams(BaseModel):
+    """Parameters for replying to an Agent Mail message."""
+
+    message_id: int
+    body: str
+    subject: str | None = None
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailAckParams(BaseModel):
+    """Parameters for acknowledging an Agent Mail message."""
+
+    message_id: int
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailAckManyParams(BaseModel):
+    """Parameters for acknowledging several Agent Mail messages at once."""
+
+    message_ids: list[int] = Field(min_length=1, max_length=100)
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailDeleteParams(BaseModel):
+    """Parameters for deleting (archiving) an Agent Mail message."""
+
+    message_id: int
+    agent_name: str | None = None
+    project_key: str | None = None
+
+
+class MailDeleteManyParams(BaseModel):
+    """Parameters for deleting (archiving) several Agent Mail messages at once."""
+
+    message_ids: list[int] = Field(min_length=1, max_length=100)
+    agent_name: str | None = None
+    project_key: str | None = None
@@ -654,7 +654,25 @@ async def validate(
 
 async def async_main() -> None:
     """Async entry point for the MCP server."""
-    await mcp.run_async(transport="stdio")
+    # Pre-open the Agent Mail connection on this loop so the first mail call is warm
+    warmup = None
+    if os.environ.get("BEADS_AGENT_MAIL_URL"):
+        # Imported here so servers without Agent Mail never load the mail client
+        from beads_mcp.mail import warm_connection
+
+        warmup = asyncio.create_task(warm_connection())
+
+    try:
+        await mcp.run_async(transport="stdio")
+    finally:
+        if warmup is not None:
+            if not warmup.done():
+                warmup.cancel()
+
+            # Finish mark-read calls mail_read left running in the background
+            from beads_mcp.mail import drain_background_tasks
+
+            await drain_background_tasks()
 
 
 def main() -> None:
@@ -1,183 +1,511 @@
 """Tests for Agent Mail messaging integration."""
 
+import json
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from beads_mcp.mail import (
     MailError,
+    _reset_config_cache,
     mail_ack,
+    mail_ack_many,
     mail_delete,
+    mail_delete_many,
     mail_inbox,
+    mail_inbox_iter,
     mail_read,
+    mail_read_and_reply,
+    mail_read_many,
     mail_reply,
     mail_send,
 )
 from beads_mcp.models import (
-    MailAckParams,
-    MailDeleteParams,
+    MailAckManyParams,
     MailInboxParams,
-    MailReadParams,
-    MailReplyParams,
+    MailReadManyParams,
     MailSendParams,
 )
 
 
+class _Resp:
+    """Minimal stand-in for an httpx.Response."""
+
+    __slots__ = ("status_code", "content", "headers")
+
+    def __init__(self, status_code, payload=b"", headers=None):
+        self.status_code = status_code
+        self.content = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.headers = headers or {}
+
+    @property
+    def text(self):
+        return self.content.decode(errors="replace")
+
+
+def _request_body(call_kwargs):
+    """Decode the JSON body sent in a mocked request."""
+    return json.loads(call_kwargs["content"])
+
+
+def _batch_response(call_kwargs, results):
+    """Answer a mocked JSON-RPC batch, one response per call, in reverse order.
+
+    Results are given in call order; dicts with an "error" key become error responses.
+    """
+    responses = [
+        {"jsonrpc": "2.0", "id": call["id"], **(result if "error" in result else {"result": result})}
+        for call, result in zip(_request_body(call_kwargs), results, strict=True)
+    ]
+    return _Resp(200, responses[::-1])
+
+
+def _drain_background():
+    """Wait for fire-and-forget calls started by the blocking wrappers."""
+    from beads_mcp import mail
+
+    mail._run_sync(mail.drain_background_tasks())
+
+
+def _decode_cursor(cursor):
+    """Decode an opaque inbox cursor for assertions."""
+    import base64
+
+    return json.loads(base64.urlsafe_b64decode(cursor))
+
+
 @pytest.fixture
-def mock_agent_mail_env(tmp_path):
+def mock_agent_mail_env(tmp_path, monkeypatch):
     """Set up Agent Mail environment variables."""
-    old_env = os.environ.copy()
-    
-    os.environ["BEADS_AGENT_MAIL_URL"] = "http://127.0.0.1:8765"
-    os.environ["BEADS_AGENT_NAME"] = "test-agent"
-    os.environ["BEADS_PROJECT_ID"] = str(tmp_path)
-    
+    monkeypatch.setenv("BEADS_AGENT_MAIL_URL", "http://127.0.0.1:8765")
+    monkeypatch.setenv("BEADS_AGENT_NAME", "test-agent")
+    monkeypatch.setenv("BEADS_PROJECT_ID", str(tmp_path))
+    _reset_config_cache()
+
     yield
-    
-    # Restore environment
-    os.environ.clear()
-    os.environ.update(old_env)
+
+    _reset_config_cache()
+
+
+@pytest.fixture
+def no_backoff():
+    """Skip retry backoff sleeps so retry tests run instantly."""
+    with patch("beads_mcp.mail.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
 
 
 @pytest.fixture
 def mock_requests():
-    """Mock requests library for HTTP calls."""
-    with patch("beads_mcp.mail.requests.request") as mock_req:
+    """Mock the shared Agent Mail client for HTTP calls."""
+    with patch("beads_mcp.mail.httpx.AsyncClient.request", new_callable=AsyncMock) as mock_req:
+        mock_req.return_value = _Resp(200)
         yield mock_req
+        # Don't let background mark-read calls outlive the mock
+        _drain_background()
 
 
 class TestMailConfiguration:
     """Test configuration and error handling."""
-    
-    def test_missing_url_raises_error(self):
+
+    def test_missing_url_raises_error(self, monkeypatch):
         """Test that missing BEADS_AGENT_MAIL_URL raises NOT_CONFIGURED."""
-        old_url = os.environ.pop("BEADS_AGENT_MAIL_URL", None)
-        
-        try:
-            with pytest.raises(MailError) as exc_info:
-                mail_send(to=["alice"], subject="Test", body="Test")
-            
-            assert exc_info.value.code == "NOT_CONFIGURED"
-            assert "BEADS_AGENT_MAIL_URL" in exc_info.value.message
-        finally:
-            if old_url:
-                os.environ["BEADS_AGENT_MAIL_URL"] = old_url
-    
-    def test_missing_agent_name_derives_default(self, mock_agent_mail_env, mock_requests, tmp_path):
+        monkeypatch.delenv("BEADS_AGENT_MAIL_URL", raising=False)
+        _reset_config_cache()
+
+        with pytest.raises(MailError) as exc_info:
+            mail_send(to=["alice"], subject="Test", body="Test")
+
+        assert exc_info.value.code == "NOT_CONFIGURED"
+        assert "BEADS_AGENT_MAIL_URL" in exc_info.value.message
+
+    def test_missing_agent_name_derives_default(self, mock_agent_mail_env, mock_requests, tmp_path, monkeypatch):
         """Test that missing BEADS_AGENT_NAME derives from user/repo."""
-        del os.environ["BEADS_AGENT_NAME"]
-        os.environ["BEADS_PROJECT_ID"] = str(tmp_path)
-        
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        monkeypatch.delenv("BEADS_AGENT_NAME")
+        monkeypatch.setenv("BEADS_PROJECT_ID", str(tmp_path))
+        _reset_config_cache()
+
+        mock_requests.return_value = _Resp(200, {
             "deliveries": [{
                 "payload": {
                     "id": 123,
                     "thread_id": "thread-1",
                 }
             }]
-        }
-        mock_requests.return_value.content = b'{"deliveries": []}'
-        
+        })
+
         # Should not raise - derives agent name
         result = mail_send(to=["alice"], subject="Test", body="Test")
         assert result["message_id"] == 123
 
 
+    def test_derived_agent_name_prefers_env_user(self, mock_agent_mail_env, monkeypatch):
+        """Test that the derived agent name uses $USER without calling getpass."""
+        from beads_mcp.mail import _get_config
+
+        monkeypatch.delenv("BEADS_AGENT_NAME")
+        monkeypatch.setenv("USER", "envuser")
+
+        with patch("beads_mcp.mail.getpass.getuser") as mock_getuser:
+            agent_name = _get_config()[1]
+
+        assert agent_name == f"envuser-{os.path.basename(os.getcwd())}"
+        mock_getuser.assert_not_called()
+
+    def test_derived_agent_name_follows_cwd_and_user(self, mock_agent_mail_env, monkeypatch, tmp_path):
+        """Test that a derived agent name is cached per directory and $USER, like the project key."""
+        from beads_mcp.mail import _get_config
+
+        monkeypatch.delenv("BEADS_AGENT_NAME")
+        monkeypatch.setenv("USER", "envuser")
+        (tmp_path / "repo-a").mkdir()
+        (tmp_path / "repo-b").mkdir()
+
+        monkeypatch.chdir(tmp_path / "repo-a")
+        assert _get_config()[1] == "envuser-repo-a"
+
+        monkeypatch.chdir(tmp_path / "repo-b")
+        assert _get_config()[1] == "envuser-repo-b"
+
+        monkeypatch.setenv("USER", "other")
+        assert _get_config()[1] == "other-repo-b"
+
+    def test_config_cached_until_reset(self, mock_agent_mail_env, monkeypatch):
+        """Test that configuration is read once and refreshed on reset."""
+        from beads_mcp.mail import _get_config
+
+        assert _get_config()[1] == "test-agent"
+
+        monkeypatch.setenv("BEADS_AGENT_NAME", "other-agent")
+        assert _get_config()[1] == "test-agent"
+
+        _reset_config_cache()
+        assert _get_config()[1] == "other-agent"
+
+    def test_base_url_trailing_slash_normalized(self, mock_agent_mail_env, mock_requests, monkeypatch):
+        """Test that endpoint URLs are built without a doubled slash."""
+        monkeypatch.setenv("BEADS_AGENT_MAIL_URL", "http://127.0.0.1:8765/")
+        _reset_config_cache()
+
+        mock_requests.return_value = _Resp(200, {})
+
+        mail_ack(message_id=123)
+
+        assert mock_requests.call_args.kwargs["url"] == "http://127.0.0.1:8765/mcp/call"
+
+    def test_endpoint_url_cached_until_reset(self, mock_agent_mail_env, monkeypatch):
+        """Test that the MCP call URL is built once and refreshed on reset."""
+        from beads_mcp.mail import _get_endpoint_url
+
+        assert _get_endpoint_url() == "http://127.0.0.1:8765/mcp/call"
+
+        monkeypatch.setenv("BEADS_AGENT_MAIL_URL", "http://127.0.0.1:9000/prefix/")
+        assert _get_endpoint_url() == "http://127.0.0.1:8765/mcp/call"
+
+        _reset_config_cache()
+        assert _get_endpoint_url() == "http://127.0.0.1:9000/prefix/mcp/call"
+
+    def test_project_id_cached_until_reset(self, mock_agent_mail_env, tmp_path, monkeypatch):
+        """Test that BEADS_PROJECT_ID is read once and refreshed on reset."""
+        from beads_mcp.mail import _get_project_key
+
+        assert _get_project_key() == str(tmp_path)
+
+        monkeypatch.setenv("BEADS_PROJECT_ID", "/other/project")
+        assert _get_project_key() == str(tmp_path)
+
+        _reset_config_cache()
+        assert _get_project_key() == "/other/project"
+
+    def test_project_key_cached_per_directory(self, mock_agent_mail_env, tmp_path, monkeypatch):
+        """Test that the workspace walk runs once per directory."""
+        from beads_mcp.mail import _get_project_key
+
+        monkeypatch.delenv("BEADS_PROJECT_ID")
+
+        with patch("beads_mcp.tools._find_beads_db_in_tree", return_value=str(tmp_path)) as mock_find:
+            assert _get_project_key() == str(tmp_path)
+            assert _get_project_key() == str(tmp_path)
+
+        assert mock_find.call_count == 1
+
+
+class TestMailClient:
+    """Test shared HTTP client reuse."""
+
+    async def test_client_reused_within_loop(self, mock_agent_mail_env):
+        """Test that consecutive calls on one loop share a pooled client."""
+        from beads_mcp.mail import _get_async_client
+
+        client = _get_async_client()
+        assert _get_async_client() is client
+
+    async def test_client_uses_http2_when_available(self, mock_agent_mail_env):
+        """Test that HTTP/2 is enabled only when h2 is installed."""
+        from beads_mcp import mail
+
+        client = mail._get_async_client()
+        assert client._transport._pool._http2 is mail._http2_available()
+
+    async def test_client_sends_token(self, mock_agent_mail_env, monkeypatch):
+        """Test that the auth token is configured once on the shared client."""
+        from beads_mcp.mail import _get_async_client
+
+        monkeypatch.setenv("BEADS_AGENT_MAIL_TOKEN", "secret")
+        _reset_config_cache()
+
+        client = _get_async_client()
+        assert client.headers["Authorization"] == "Bearer secret"
+
+    async def test_client_skips_compression_on_loopback(self, mock_agent_mail_env, monkeypatch):
+        """Test that gzip is only requested from non-local servers."""
+        from beads_mcp.mail import _get_async_client
+
+        assert _get_async_client().headers["Accept-Encoding"] == "identity"
+
+        monkeypatch.setenv("BEADS_AGENT_MAIL_URL", "https://mail.example.com")
+        _reset_config_cache()
+        assert _get_async_client().headers["Accept-Encoding"] == "gzip"
+
+    async def test_client_uses_unix_socket_for_loopback(self, mock_agent_mail_env, monkeypatch, tmp_path, caplog):
+        """Test that BEADS_AGENT_MAIL_SOCKET routes loopback traffic over a UNIX socket."""
+        from beads_mcp.mail import _get_async_client
+
+        socket_path = str(tmp_path / "agent-mail.sock")
+        monkeypatch.setenv("BEADS_AGENT_MAIL_SOCKET", socket_path)
+        _reset_config_cache()
+        assert _get_async_client()._transport._pool._uds == socket_path
+
+        # Remote servers keep using TCP, and the ignored socket is reported
+        monkeypatch.setenv("BEADS_AGENT_MAIL_URL", "https://mail.example.com")
+        _reset_config_cache()
+        with caplog.at_level("WARNING", logger="beads_mcp.mail"):
+            assert _get_async_client()._transport._pool._uds is None
+        assert "Ignoring BEADS_AGENT_MAIL_SOCKET" in caplog.text
+
+    async def test_warm_connection_opens_client(self, mock_agent_mail_env, mock_requests):
+        """Test that warm-up issues a lightweight request on the shared client."""
+        from beads_mcp.mail import warm_connection
+
+        await warm_connection()
+
+        assert mock_requests.call_args.kwargs["method"] == "HEAD"
+        assert mock_requests.call_args.kwargs["url"] == "http://127.0.0.1:8765/"
+
+    async def test_warm_connection_swallows_errors(self, mock_agent_mail_env, mock_requests):
+        """Test that warm-up failures never propagate."""
+        from beads_mcp.mail import warm_connection
+
+        mock_requests.side_effect = httpx.ConnectError("Connection refused")
+
+        await warm_connection()
+
+    def test_sync_wrappers_share_client(self, mock_agent_mail_env, mock_requests):
+        """Test that blocking calls reuse one client (and its connections)."""
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(200, {})
+
+        mail_ack(message_id=1)
+        client = mail._ASYNC_CLIENTS.get(mail._SYNC_LOOP)
+        mail_ack(message_id=2)
+
+        assert client is not None
+        assert mail._ASYNC_CLIENTS.get(mail._SYNC_LOOP) is client
+
+    async def test_each_loop_keeps_its_client(self, mock_agent_mail_env, mock_requests):
+        """Test that alternating between the server loop and the blocking wrappers' loop reuses both clients."""
+        import asyncio
+
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(200, {})
+        client = mail._get_async_client()
+
+        await asyncio.to_thread(mail_ack, message_id=1)
+        sync_client = mail._ASYNC_CLIENTS.get(mail._SYNC_LOOP)
+        await asyncio.to_thread(mail_ack, message_id=2)
+
+        assert sync_client is not None
+        assert sync_client is not client
+        assert mail._get_async_client() is client
+        assert mail._ASYNC_CLIENTS.get(mail._SYNC_LOOP) is sync_client
+
+    async def test_reset_closes_replaced_client(self, mock_agent_mail_env):
+        """Test that clients dropped on a config reset are closed on their own loop."""
+        from beads_mcp import mail
+
+        client = mail._get_async_client()
+        _reset_config_cache()
+        await mail.drain_background_tasks()
+
+        assert client.is_closed
+        assert mail._get_async_client() is not client
+
+    def test_fork_resets_http_state(self, mock_agent_mail_env, mock_requests):
+        """Test that a forked child does not reuse the parent's client or loop."""
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(200, {})
+        mail_ack(message_id=1)
+        assert mail._ASYNC_CLIENTS
+
+        parent_loop = mail._SYNC_LOOP
+        parent_client = mail._ASYNC_CLIENTS[parent_loop]
+        mail._reset_after_fork()
+
+        assert not mail._ASYNC_CLIENTS
+        # Closing it would shut down the parent's connections too
+        assert not parent_client.is_closed
+        assert mail._SYNC_LOOP is None
+        # Restore so the parent's loop thread keeps serving later tests
+        mail._SYNC_LOOP = parent_loop
+
+    def test_fork_does_not_wait_for_read_cache_lock(self, mock_agent_mail_env):
+        """Test that the fork hook doesn't deadlock on a read-cache lock held by another thread."""
+        import threading
+
+        from beads_mcp import mail
+
+        parent_loop = mail._SYNC_LOOP
+        held = mail._READ_CACHE_LOCK
+        held.acquire()
+        try:
+            child = threading.Thread(target=mail._reset_after_fork, daemon=True)
+            child.start()
+            child.join(timeout=2)
+            assert not child.is_alive()
+            assert mail._READ_CACHE_LOCK is not held
+        finally:
+            held.release()
+            mail._SYNC_LOOP = parent_loop
+
+    def test_client_recreated_for_new_loop(self, mock_agent_mail_env):
+        """Test that a client bound to a finished loop is not reused."""
+        import asyncio
+
+        from beads_mcp.mail import _get_async_client
+
+        async def get_client():
+            return _get_async_client()
+
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+
+
 class TestMailSend:
     """Test mail_send function."""
-    
+
     def test_send_basic_message(self, mock_agent_mail_env, mock_requests):
         """Test sending a basic message."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        mock_requests.return_value = _Resp(200, {
             "deliveries": [{
                 "payload": {
                     "id": 123,
                     "thread_id": "thread-abc",
                 }
             }]
-        }
-        mock_requests.return_value.content = b'{"deliveries": []}'
-        
+        })
+
         result = mail_send(
             to=["alice", "bob"],
             subject="Test Message",
             body="Hello world!",
         )
-        
+
         assert result["message_id"] == 123
         assert result["thread_id"] == "thread-abc"
         assert result["sent_to"] == 1
-        
+
         # Verify HTTP request
         mock_requests.assert_called_once()
         call_kwargs = mock_requests.call_args.kwargs
         assert call_kwargs["method"] == "POST"
-        assert call_kwargs["json"]["params"]["name"] == "send_message"
-        assert call_kwargs["json"]["params"]["arguments"]["to"] == ["alice", "bob"]
-        assert call_kwargs["json"]["params"]["arguments"]["subject"] == "Test Message"
-    
+        assert _request_body(call_kwargs)["params"]["name"] == "send_message"
+        assert _request_body(call_kwargs)["params"]["arguments"]["to"] == ["alice", "bob"]
+        assert _request_body(call_kwargs)["params"]["arguments"]["subject"] == "Test Message"
+
     def test_send_urgent_message(self, mock_agent_mail_env, mock_requests):
         """Test sending urgent message."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        mock_requests.return_value = _Resp(200, {
             "deliveries": [{
                 "payload": {"id": 456, "thread_id": "thread-xyz"}
             }]
-        }
-        mock_requests.return_value.content = b'{"deliveries": []}'
-        
-        result = mail_send(
+        })
+
+        mail_send(
             to=["alice"],
             subject="URGENT",
             body="Need review now!",
             urgent=True,
         )
-        
+
         call_kwargs = mock_requests.call_args.kwargs
-        assert call_kwargs["json"]["params"]["arguments"]["importance"] == "urgent"
-    
+        assert _request_body(call_kwargs)["params"]["arguments"]["importance"] == "urgent"
+
     def test_send_with_cc(self, mock_agent_mail_env, mock_requests):
         """Test sending message with CC recipients."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        mock_requests.return_value = _Resp(200, {
             "deliveries": [{
                 "payload": {"id": 789, "thread_id": "thread-123"}
             }]
-        }
-        mock_requests.return_value.content = b'{"deliveries": []}'
-        
-        result = mail_send(
+        })
+
+        mail_send(
             to=["alice"],
             subject="FYI",
             body="For your info",
             cc=["bob", "charlie"],
         )
-        
+
         call_kwargs = mock_requests.call_args.kwargs
-        assert call_kwargs["json"]["params"]["arguments"]["cc"] == ["bob", "charlie"]
-    
+        assert _request_body(call_kwargs)["params"]["arguments"]["cc"] == ["bob", "charlie"]
+
     def test_send_connection_error(self, mock_agent_mail_env, mock_requests):
         """Test handling connection errors."""
-        import requests.exceptions
-        mock_requests.side_effect = requests.exceptions.ConnectionError("Connection refused")
-        
+        mock_requests.side_effect = httpx.ConnectError("Connection refused")
+
         with pytest.raises(MailError) as exc_info:
             mail_send(to=["alice"], subject="Test", body="Test")
-        
+
         assert exc_info.value.code == "UNAVAILABLE"
         assert "Cannot connect" in exc_info.value.message
+        # Refused connections fail fast instead of retrying
+        assert mock_requests.call_count == 1
+
+    def test_send_dns_failure_fails_fast(self, mock_agent_mail_env, mock_requests):
+        """Test that an unresolvable host is not retried."""
+        import socket
+
+        error = httpx.ConnectError("[Errno -2] Name or service not known")
+        error.__cause__ = socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+        mock_requests.side_effect = error
+
+        with pytest.raises(MailError) as exc_info:
+            mail_send(to=["alice"], subject="Test", body="Test")
+
+        assert exc_info.value.code == "UNAVAILABLE"
+        assert mock_requests.call_count == 1
+
+    def test_send_transient_connect_error_retries(self, mock_agent_mail_env, mock_requests, no_backoff):
+        """Test that transient connection failures are retried."""
+        mock_requests.side_effect = httpx.ConnectError("Connection reset by peer")
+
+        with pytest.raises(MailError) as exc_info:
+            mail_send(to=["alice"], subject="Test", body="Test")
+
+        assert exc_info.value.code == "UNAVAILABLE"
+        assert mock_requests.call_count == 3
 
 
 class TestMailInbox:
     """Test mail_inbox function."""
-    
+
     def test_fetch_inbox_default(self, mock_agent_mail_env, mock_requests):
         """Test fetching inbox with default parameters."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = [
+        mock_requests.return_value = _Resp(200, [
             {
                 "id": 1,
                 "thread_id": "thread-1",
@@ -200,11 +528,10 @@ class TestMailInbox:
                 "importance": "urgent",
                 "body_md": "Please review ASAP",
             },
-        ]
-        mock_requests.return_value.content = b'[]'
-        
+        ])
+
         result = mail_inbox()
-        
+
         assert len(result["messages"]) == 2
         assert result["messages"][0]["id"] == 1
         assert result["messages"][0]["unread"] is True
@@ -212,46 +539,276 @@ class TestMailInbox:
         assert result["messages"][1]["id"] == 2
         assert result["messages"][1]["unread"] is False
         assert result["messages"][1]["urgent"] is True
-    
+
     def test_fetch_inbox_unread_only(self, mock_agent_mail_env, mock_requests):
-        """Test fetching only unread messages."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = [
-            {"id": 1, "thread_id": "t1", "from": "alice", "subject": "Test", "created_ts": "2025-01-01T00:00:00Z", "read_ts": None, "importance": "normal"},
-            {"id": 2, "thread_id": "t2", "from": "bob", "subject": "Test2", "created_ts": "2025-01-01T00:00:00Z", "read_ts": "2025-01-01T01:00:00Z", "importance": "normal"},
-        ]
-        mock_requests.return_value.content = b'[]'
-        
+        """Test that unread_only is pushed to the server."""
+        mock_requests.return_value = _Resp(200, [
+            {
+                "id": 1, "thread_id": "t1", "from": "alice", "subject": "Test",
+                "created_ts": "2025-01-01T00:00:00Z", "read_ts": None, "importance": "normal",
+            },
+        ])
+
         result = mail_inbox(unread_only=True)
-        
-        # Should filter out message 2 (read)
+
+        arguments = _request_body(mock_requests.call_args.kwargs)["params"]["arguments"]
+        assert arguments["unread_only"] is True
+        assert arguments["limit"] == 20
         assert len(result["messages"]) == 1
         assert result["messages"][0]["id"] == 1
-    
+        # Fields missing from the server record fall back to defaults
+        assert result["messages"][0]["ack_required"] is False
+        assert result["messages"][0]["preview"] == ""
+
+    def test_fetch_inbox_unread_only_ignored_by_server(self, mock_agent_mail_env, mock_requests):
+        """Test that read messages are filtered client-side if the server ignores unread_only."""
+        mock_requests.return_value = _Resp(200, [
+            {
+                "id": 1, "thread_id": "t1", "from": "alice", "subject": "Test",
+                "created_ts": "2025-01-01T00:00:00Z", "read_ts": None, "importance": "normal",
+            },
+            {
+                "id": 2, "thread_id": "t2", "from": "bob", "subject": "Test2",
+                "created_ts": "2025-01-01T00:00:00Z", "read_ts": "2025-01-01T01:00:00Z", "importance": "normal",
+            },
+        ])
+
+        with pytest.warns(RuntimeWarning, match="ignored"):
+            result = mail_inbox(unread_only=True)
+
+        # Should filter out message 2 (read)
+        assert [m["id"] for m in result["messages"]] == [1]
+
+        # Later calls filter client-side without asking the server again
+        mail_inbox(unread_only=True)
+        assert "unread_only" not in _request_body(mock_requests.call_args.kwargs)["params"]["arguments"]
+
+    def test_fetch_inbox_unread_only_rejected_by_server(self, mock_agent_mail_env, mock_requests):
+        """Test falling back to client-side filtering when the server rejects unread_only."""
+        rejected = _Resp(400, b'{"error": "unexpected argument unread_only"}')
+        accepted = _Resp(200, [
+            {
+                "id": 1, "thread_id": "t1", "from": "alice", "subject": "Test",
+                "created_ts": "2025-01-01T00:00:00Z", "read_ts": None, "importance": "normal",
+            },
+        ])
+        mock_requests.side_effect = [rejected, accepted]
+
+        with pytest.warns(RuntimeWarning, match="rejected"):
+            result = mail_inbox(unread_only=True)
+
+        assert [m["id"] for m in result["messages"]] == [1]
+        retry_arguments = _request_body(mock_requests.call_args.kwargs)["params"]["arguments"]
+        assert "unread_only" not in retry_arguments
+        assert retry_arguments["limit"] == 40
+
+    def test_fetch_inbox_auth_failure_keeps_server_filter(self, mock_agent_mail_env, mock_requests):
+        """Test that a rejected token is raised and doesn't turn off the server-side unread filter."""
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(401, b'{"detail": "Invalid token"}')
+
+        with pytest.raises(MailError) as exc_info:
+            mail_inbox(unread_only=True)
+
+        assert exc_info.value.status == 401
+        assert mock_requests.call_count == 1
+        assert mail._UNREAD_FILTER_SUPPORTED is not False
+
+    def test_fetch_inbox_unread_only_fills_page(self, mock_agent_mail_env, mock_requests):
+        """Test that client-side unread_only over-fetches and trims to the requested limit."""
+        mock_requests.return_value = _Resp(200, [
+            {
+                "id": i, "thread_id": f"t{i}", "from": "alice", "subject": f"Msg {i}",
+                "created_ts": "2025-01-01T00:00:00Z", "read_ts": "2025-01-01T01:00:00Z" if i % 3 == 0 else None,
+                "importance": "normal",
+            }
+            for i in range(10)
+        ])
+
+        with patch("beads_mcp.mail._UNREAD_FILTER_SUPPORTED", False):
+            result = mail_inbox(limit=5, unread_only=True)
+
+        assert _request_body(mock_requests.call_args.kwargs)["params"]["arguments"]["limit"] == 10
+        assert [m["id"] for m in result["messages"]] == [1, 2, 4, 5, 7]
+        assert _decode_cursor(result["next_cursor"])["id"] == 7
+
+    def test_fetch_inbox_stops_projecting_past_page(self, mock_agent_mail_env, mock_requests):
+        """Test that records beyond the first overflowing match are never projected."""
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(200, [
+            {
+                "id": i, "thread_id": f"t{i}", "from": "alice", "subject": f"Msg {i}",
+                "created_ts": "2025-01-01T00:00:00Z", "read_ts": None, "importance": "normal",
+            }
+            for i in range(10)
+        ])
+
+        with (
+            patch("beads_mcp.mail._UNREAD_FILTER_SUPPORTED", False),
+            patch("beads_mcp.mail._INBOX_FIELDS", wraps=mail._INBOX_FIELDS) as fields,
+        ):
+            result = mail_inbox(limit=5, unread_only=True)
+
+        assert len(result["messages"]) == 5
+        assert fields.call_count == 6
+
     def test_fetch_inbox_pagination(self, mock_agent_mail_env, mock_requests):
         """Test inbox pagination with next_cursor."""
-        mock_requests.return_value.status_code = 200
         # Simulate full page (limit reached)
-        mock_requests.return_value.json.return_value = [
-            {"id": i, "thread_id": f"t{i}", "from": "alice", "subject": f"Msg {i}", "created_ts": "2025-01-01T00:00:00Z", "importance": "normal"}
+        mock_requests.return_value = _Resp(200, [
+            {
+                "id": i, "thread_id": f"t{i}", "from": "alice", "subject": f"Msg {i}",
+                "created_ts": "2025-01-01T00:00:00Z", "importance": "normal",
+            }
             for i in range(20)
-        ]
-        mock_requests.return_value.content = b'[]'
-        
+        ])
+
         result = mail_inbox(limit=20)
-        
-        # Should return next_cursor when limit reached
-        assert result["next_cursor"] == "19"  # Last message ID
+
+        # Should return an opaque next_cursor positioned after the last message
+        assert result["next_cursor"] is not None
+        assert _decode_cursor(result["next_cursor"]) == {"id": 19, "ts": "2025-01-01T00:00:00Z"}
+
+        # Passing the cursor back forwards it to the server
+        mail_inbox(limit=20, cursor=result["next_cursor"])
+        arguments = _request_body(mock_requests.call_args.kwargs)["params"]["arguments"]
+        assert arguments["cursor"] == result["next_cursor"]
+
+    def test_fetch_inbox_first_page_sends_no_cursor(self, mock_agent_mail_env, mock_requests):
+        """Test that the first page request omits the cursor argument."""
+        mock_requests.return_value = _Resp(200, b'[]')
+
+        mail_inbox()
+
+        assert "cursor" not in _request_body(mock_requests.call_args.kwargs)["params"]["arguments"]
+
+    def test_fetch_inbox_uses_server_cursor(self, mock_agent_mail_env, mock_requests):
+        """Test that a server-supplied cursor is passed through unchanged."""
+        mock_requests.return_value = _Resp(200, {
+            "messages": [
+                {
+                    "id": i, "thread_id": f"t{i}", "from": "alice", "subject": f"Msg {i}",
+                    "created_ts": "2025-01-01T00:00:00Z", "importance": "normal",
+                }
+                for i in range(2)
+            ],
+            "next_cursor": "server-token",
+        })
+
+        result = mail_inbox(limit=2)
+
+        assert [m["id"] for m in result["messages"]] == [0, 1]
+        assert result["next_cursor"] == "server-token"
+
+
+class TestMailInboxIter:
+    """Test paginated inbox iteration with prefetch."""
+
+    @staticmethod
+    def _paged_inbox(pages, served=None, delay=0.01):
+        """Build a request side effect serving the given pages by cursor.
+
+        Indexes of pages whose response completed are appended to served.
+        """
+        import asyncio
+
+        async def respond(**kwargs):
+            cursor = _request_body(kwargs)["params"]["arguments"].get("cursor")
+            index = 0 if cursor is None else _decode_cursor(cursor)["id"] // 100 + 1
+            await asyncio.sleep(delay)
+            if served is not None:
+                served.append(index)
+            return _Resp(200, pages[index])
+
+        return respond
+
+    @staticmethod
+    def _page(index, count):
+        return [
+            {
+                "id": index * 100 + i, "thread_id": "t", "from": "alice", "subject": "s",
+                "created_ts": "2025-01-01T00:00:00Z", "importance": "normal",
+            }
+            for i in range(count)
+        ]
+
+    def test_iterates_all_pages(self, mock_agent_mail_env, mock_requests):
+        """Test that iteration follows cursors until a short page."""
+        respond = self._paged_inbox([self._page(0, 2), self._page(1, 2), self._page(2, 1)])
+        mock_requests.side_effect = respond
+
+        ids = [msg["id"] for msg in mail_inbox_iter(limit=2)]
+
+        assert ids == [0, 1, 100, 101, 200]
+        assert mock_requests.call_count == 3
+
+    def test_stops_when_server_ignores_cursor(self, mock_agent_mail_env, mock_requests):
+        """Test that a server returning the same full page for every cursor doesn't loop forever."""
+        mock_requests.return_value = _Resp(200, self._page(0, 2))
+
+        ids = [msg["id"] for msg in mail_inbox_iter(limit=2)]
+
+        assert ids == [0, 1]
+        assert mock_requests.call_count == 2
+
+    def test_stops_when_server_repeats_page_with_new_cursor(self, mock_agent_mail_env, mock_requests):
+        """Test that a repeated page is detected even if the server mints a fresh cursor each time."""
+        tokens = iter(range(100))
+        mock_requests.side_effect = lambda **kwargs: _Resp(
+            200, {"messages": self._page(0, 2), "next_cursor": f"token-{next(tokens)}"}
+        )
+
+        ids = [msg["id"] for msg in mail_inbox_iter(limit=2)]
+
+        assert ids == [0, 1]
+        assert mock_requests.call_count == 2
+
+    async def test_prefetches_next_page(self, mock_agent_mail_env, mock_requests):
+        """Test that the next page is in flight while the caller handles the current one."""
+        import asyncio
+
+        from beads_mcp.mail import async_mail_inbox_iter
+
+        respond = self._paged_inbox([self._page(0, 2), self._page(1, 0)])
+        mock_requests.side_effect = respond
+
+        pages = async_mail_inbox_iter(limit=2)
+        first = await pages.__anext__()
+        assert first["id"] == 0
+        await asyncio.sleep(0)
+        # Page 2 was requested before page 1 was fully consumed
+        assert mock_requests.call_count == 2
+
+        remaining = [msg async for msg in pages]
+        assert [m["id"] for m in remaining] == [1]
+
+    def test_early_stop_cancels_prefetch(self, mock_agent_mail_env, mock_requests):
+        """Test that breaking out of iteration doesn't leave work behind."""
+        import time
+
+        served = []
+        mock_requests.side_effect = self._paged_inbox([self._page(0, 2), self._page(1, 2)], served, delay=0.1)
+
+        messages = mail_inbox_iter(limit=2)
+        assert next(messages)["id"] == 0
+        messages.close()
+
+        # The prefetch of page 2 was cancelled before its response arrived,
+        # and nothing past it was ever requested
+        time.sleep(0.2)
+        assert served == [0]
+        assert mock_requests.call_count <= 2
 
 
 class TestMailRead:
     """Test mail_read function."""
-    
+
     def test_read_message_marks_read(self, mock_agent_mail_env, mock_requests):
         """Test reading message marks it as read by default."""
         # Mock resource fetch
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        mock_requests.return_value = _Resp(200, {
             "contents": [{
                 "id": 123,
                 "thread_id": "thread-1",
@@ -264,22 +821,56 @@ class TestMailRead:
                 "importance": "normal",
                 "read_ts": None,
             }]
-        }
-        mock_requests.return_value.content = b'{}'
-        
+        })
+
         result = mail_read(message_id=123)
-        
+        _drain_background()
+
         assert result["id"] == 123
         assert result["body"] == "Hello world!"
         assert result["urgent"] is False
-        
+
         # Should have called both GET resource and POST mark_read
         assert mock_requests.call_count == 2
-    
+
+    def test_read_message_does_not_wait_for_mark_read(self, mock_agent_mail_env, mock_requests):
+        """Test that mail_read returns once the fetch completes, leaving mark-read in the background."""
+        import asyncio
+
+        marked = []
+        response = _Resp(200, {"contents": [{"id": 123, "body_md": "Hi"}]})
+
+        async def slow_mark(**kwargs):
+            if kwargs["method"] == "POST":
+                await asyncio.sleep(0.2)
+                marked.append(json.loads(kwargs["content"])["params"]["name"])
+            return response
+
+        mock_requests.side_effect = slow_mark
+
+        result = mail_read(message_id=123)
+
+        assert result["body"] == "Hi"
+        assert marked == []
+
+        _drain_background()
+        assert marked == ["mark_message_read"]
+
+    def test_read_missing_message_not_marked(self, mock_agent_mail_env, mock_requests):
+        """Test that no mark-read call is sent when the fetch fails."""
+        mock_requests.return_value = _Resp(404, b'{"error": "not found"}')
+
+        with pytest.raises(MailError) as exc_info:
+            mail_read(message_id=999)
+        _drain_background()
+
+        assert exc_info.value.code == "NOT_FOUND"
+        assert mock_requests.call_count == 1
+        assert mock_requests.call_args.kwargs["method"] == "GET"
+
     def test_read_message_no_mark(self, mock_agent_mail_env, mock_requests):
         """Test reading without marking as read."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        mock_requests.return_value = _Resp(200, {
             "contents": [{
                 "id": 123,
                 "thread_id": "thread-1",
@@ -290,97 +881,520 @@ class TestMailRead:
                 "created_ts": "2025-01-01T00:00:00Z",
                 "importance": "normal",
             }]
-        }
-        mock_requests.return_value.content = b'{}'
-        
+        })
+
         result = mail_read(message_id=123, mark_read=False)
-        
+
         # Should only call GET resource, not mark_read
         assert mock_requests.call_count == 1
+        assert result["ack_required"] is False
+        assert result["ack_status"] is False
+        assert result["read_ts"] is None
+
+
+    def test_read_cached_returns_without_http(self, mock_agent_mail_env, mock_requests):
+        """Test that a repeated preview is served from the read cache."""
+        mock_requests.return_value = _Resp(200, {"contents": [{"id": 123, "body_md": "Preview"}]})
+
+        first = mail_read(message_id=123, mark_read=False)
+        second = mail_read(message_id=123, mark_read=False)
+
+        assert second == first
+        assert mock_requests.call_count == 1
+
+    def test_read_cache_expires(self, mock_agent_mail_env, mock_requests):
+        """Test that cached previews are refetched after the TTL."""
+        from beads_mcp.mail import AGENT_MAIL_READ_CACHE_TTL
+
+        mock_requests.return_value = _Resp(200, {"contents": [{"id": 123, "body_md": "Preview"}]})
+
+        with patch("beads_mcp.mail.time.monotonic", return_value=1000.0):
+            mail_read(message_id=123, mark_read=False)
+        with patch("beads_mcp.mail.time.monotonic", return_value=1000.0 + AGENT_MAIL_READ_CACHE_TTL):
+            mail_read(message_id=123, mark_read=False)
+
+        assert mock_requests.call_count == 2
+
+    def test_read_cache_invalidated_on_ack(self, mock_agent_mail_env, mock_requests):
+        """Test that acknowledging a message drops its cached preview."""
+        mock_requests.return_value = _Resp(200, {"contents": [{"id": 123, "body_md": "Preview"}]})
+
+        mail_read(message_id=123, mark_read=False)
+        mail_ack(message_id=123)
+        mail_read(message_id=123, mark_read=False)
+
+        assert mock_requests.call_count == 3
+
+
+class TestMailReadMany:
+    """Test mail_read_many function."""
+
+    def test_read_many_batched(self, mock_agent_mail_env, mock_requests):
+        """Test that reads go out as one batch, then mark-read only for messages that were fetched."""
+        def respond(**kwargs):
+            calls = _request_body(kwargs)
+            if calls[0]["method"] == "resources/read":
+                return _batch_response(kwargs, [
+                    {"contents": [{"id": 3, "body_md": "Hi"}]},
+                    {"error": {"code": "NOT_FOUND", "message": "Message 2 not found"}},
+                ])
+            return _batch_response(kwargs, [{}] * len(calls))
+
+        mock_requests.side_effect = respond
+
+        results = mail_read_many(message_ids=[3, 2])
+
+        assert mock_requests.call_count == 2
+        reads, marks = (_request_body(call.kwargs) for call in mock_requests.call_args_list)
+        assert [c["method"] for c in reads] == ["resources/read", "resources/read"]
+        assert [(c["params"]["name"], c["params"]["arguments"]["message_id"]) for c in marks] == [
+            ("mark_message_read", 3)
+        ]
+        assert results[0]["body"] == "Hi"
+        assert results[1]["id"] == 2
+        assert results[1]["error"] == "NOT_FOUND"
+
+    def test_read_many_splits_large_batches(self, mock_agent_mail_env, mock_requests):
+        """Test that no batch carries more than AGENT_MAIL_BATCH_SIZE operations."""
+        from beads_mcp.mail import AGENT_MAIL_BATCH_SIZE
+
+        def respond(**kwargs):
+            calls = json.loads(kwargs["content"])
+            return _batch_response(kwargs, [{"contents": [{"id": 1, "body_md": "Hi"}]}] * len(calls))
+
+        mock_requests.side_effect = respond
+
+        results = mail_read_many(message_ids=list(range(AGENT_MAIL_BATCH_SIZE + 1)), mark_read=False)
+
+        assert len(results) == AGENT_MAIL_BATCH_SIZE + 1
+        sizes = [len(_request_body(call.kwargs)) for call in mock_requests.call_args_list]
+        assert sizes == [AGENT_MAIL_BATCH_SIZE, 1]
+
+    def test_read_many_preserves_order_and_reports_errors(self, mock_agent_mail_env, mock_requests):
+        """Test that unbatched results follow the input order and failures are reported in place."""
+        def respond(**kwargs):
+            if kwargs["method"] == "POST":
+                return _Resp(400, b'{"detail": "Unknown method"}')
+            message_id = int(kwargs["url"].rsplit("/", 1)[-1])
+            if message_id == 2:
+                return _Resp(404, b'{"error": "not found"}')
+            return _Resp(200, {"contents": [{"id": message_id, "body_md": "Hi"}]})
+
+        mock_requests.side_effect = respond
+
+        results = mail_read_many(message_ids=[3, 2, 1], mark_read=False)
+
+        assert [r["id"] for r in results] == [3, 2, 1]
+        assert results[0]["body"] == "Hi"
+        assert results[1]["error"] == "NOT_FOUND"
+        # Rejected batch + one GET per message
+        assert mock_requests.call_count == 4
+
+    def test_read_many_caps_concurrency(self, mock_agent_mail_env, mock_requests):
+        """Test that no more than AGENT_MAIL_CONCURRENCY unbatched reads run at once."""
+        import asyncio
+
+        from beads_mcp.mail import AGENT_MAIL_CONCURRENCY
+
+        in_flight = 0
+        max_in_flight = 0
+        response = _Resp(200, {"contents": [{"id": 1, "body_md": "Hi"}]})
+
+        async def slow_request(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return response
+
+        mock_requests.side_effect = slow_request
+
+        with patch("beads_mcp.mail._BATCH_SUPPORTED", False):
+            results = mail_read_many(message_ids=list(range(AGENT_MAIL_CONCURRENCY * 2)), mark_read=False)
+
+        assert len(results) == AGENT_MAIL_CONCURRENCY * 2
+        assert max_in_flight == AGENT_MAIL_CONCURRENCY
+
+    def test_read_many_uses_read_cache(self, mock_agent_mail_env, mock_requests):
+        """Test that previews cached by mail_read are not refetched."""
+        mock_requests.return_value = _Resp(200, {"contents": [{"id": 1, "body_md": "Hi"}]})
+        mail_read(message_id=1, mark_read=False)
+
+        mock_requests.side_effect = lambda **kwargs: _batch_response(
+            kwargs, [{"contents": [{"id": 2, "body_md": "Yo"}]}]
+        )
+        results = mail_read_many(message_ids=[1, 2], mark_read=False)
+
+        assert [r["body"] for r in results] == ["Hi", "Yo"]
+        assert len(_request_body(mock_requests.call_args.kwargs)) == 1
 
 
 class TestMailReply:
     """Test mail_reply function."""
-    
+
     def test_reply_to_message(self, mock_agent_mail_env, mock_requests):
         """Test replying to a message."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+        mock_requests.return_value = _Resp(200, {
             "reply": {
                 "id": 456,
                 "thread_id": "thread-1",
             }
-        }
-        mock_requests.return_value.content = b'{}'
-        
+        })
+
         result = mail_reply(
             message_id=123,
             body="Thanks for the message!",
         )
-        
+
         assert result["message_id"] == 456
         assert result["thread_id"] == "thread-1"
-        
+
         call_kwargs = mock_requests.call_args.kwargs
-        assert call_kwargs["json"]["params"]["name"] == "reply_message"
-        assert call_kwargs["json"]["params"]["arguments"]["message_id"] == 123
+        assert _request_body(call_kwargs)["params"]["name"] == "reply_message"
+        assert _request_body(call_kwargs)["params"]["arguments"]["message_id"] == 123
+
+
+class TestMailReadAndReply:
+    """Test read, followed by batched mark read + reply."""
+
+    MESSAGE = {"contents": [{"id": 123, "thread_id": "thread-1", "subject": "Test", "body_md": "Hello"}]}
+    REPLY = {"reply": {"id": 456, "thread_id": "thread-1"}}
+
+    def respond_with(self, reply):
+        """Answer the read, then the mark read + reply batch with the given reply result."""
+        def respond(**kwargs):
+            if kwargs["method"] == "GET":
+                return _Resp(200, self.MESSAGE)
+            return _batch_response(kwargs, [{}, reply])
+        return respond
+
+    def test_mark_and_reply_batched_after_read(self, mock_agent_mail_env, mock_requests):
+        """Test that the read goes first, then mark read + reply as one batch."""
+        mock_requests.side_effect = self.respond_with(self.REPLY)
+
+        result = mail_read_and_reply(message_id=123, body="Thanks!")
+
+        assert result["message"]["body"] == "Hello"
+        assert result["reply"] == {"message_id": 456, "thread_id": "thread-1"}
+        assert mock_requests.call_count == 2
+
+        read, batch = mock_requests.call_args_list
+        assert read.kwargs["method"] == "GET"
+        assert [c["params"]["name"] for c in _request_body(batch.kwargs)] == ["mark_message_read", "reply_message"]
+
+    def test_failed_read_sends_nothing_else(self, mock_agent_mail_env, mock_requests):
+        """Test that neither the mark read nor the reply is sent when the read fails."""
+        mock_requests.return_value = _Resp(404, b'{"error": "not found"}')
+
+        with pytest.raises(MailError) as exc_info:
+            mail_read_and_reply(message_id=123, body="Thanks!")
+
+        assert exc_info.value.code == "NOT_FOUND"
+        assert mock_requests.call_count == 1
+        assert mock_requests.call_args.kwargs["method"] == "GET"
+
+    def test_failed_read_sends_nothing_else_without_batching(self, mock_agent_mail_env, mock_requests):
+        """Test the same when the server is known not to accept batches."""
+        mock_requests.return_value = _Resp(404, b'{"error": "not found"}')
+
+        with patch("beads_mcp.mail._BATCH_SUPPORTED", False), pytest.raises(MailError):
+            mail_read_and_reply(message_id=123, body="Thanks!")
+
+        assert mock_requests.call_count == 1
+
+    def test_falls_back_when_batch_unsupported(self, mock_agent_mail_env, mock_requests):
+        """Test individual mark read + reply, remembered after the first rejected batch."""
+        sent = []
+
+        def respond(**kwargs):
+            body = json.loads(kwargs["content"]) if kwargs.get("content") else None
+            if isinstance(body, list):
+                return _Resp(400, b'{"detail": "Unknown method"}')
+            if kwargs["method"] == "GET":
+                sent.append("read")
+                return _Resp(200, self.MESSAGE)
+            sent.append(body["params"]["name"])
+            if body["params"]["name"] == "reply_message":
+                return _Resp(200, self.REPLY)
+            return _Resp(200, {})
+
+        mock_requests.side_effect = respond
+
+        result = mail_read_and_reply(message_id=123, body="Thanks!")
+
+        assert result["message"]["id"] == 123
+        assert result["reply"]["message_id"] == 456
+        # GET + rejected batch + mark read + reply
+        assert mock_requests.call_count == 4
+        assert sent[0] == "read"
+        assert sorted(sent[1:]) == ["mark_message_read", "reply_message"]
+
+        mail_read_and_reply(message_id=123, body="Again")
+        # Batch is not retried once the server rejected it
+        assert mock_requests.call_count == 7
+
+    def test_reply_error_raises(self, mock_agent_mail_env, mock_requests):
+        """Test that a failed reply surfaces as MailError."""
+        mock_requests.side_effect = self.respond_with({"error": {"code": "CONFLICT", "message": "Thread closed"}})
+
+        with pytest.raises(MailError) as exc_info:
+            mail_read_and_reply(message_id=123, body="Thanks!")
+
+        assert exc_info.value.code == "CONFLICT"
 
 
 class TestMailAck:
     """Test mail_ack function."""
-    
+
     def test_acknowledge_message(self, mock_agent_mail_env, mock_requests):
         """Test acknowledging a message."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {}
-        mock_requests.return_value.content = b'{}'
-        
+        mock_requests.return_value = _Resp(200, {})
+
         result = mail_ack(message_id=123)
-        
+
         assert result["acknowledged"] is True
-        
+
         call_kwargs = mock_requests.call_args.kwargs
-        assert call_kwargs["json"]["params"]["name"] == "acknowledge_message"
+        assert _request_body(call_kwargs)["params"]["name"] == "acknowledge_message"
+
+    def test_acknowledge_many_batched(self, mock_agent_mail_env, mock_requests):
+        """Test acknowledging several messages in one batch."""
+        mock_requests.side_effect = lambda **kwargs: _batch_response(
+            kwargs, [{}, {"error": {"code": "NOT_FOUND", "message": "Gone"}}]
+        )
+
+        results = mail_ack_many(message_ids=[1, 2])
+
+        assert results == [
+            {"id": 1, "acknowledged": True},
+            {"id": 2, "acknowledged": False, "error": "NOT_FOUND", "message": "Gone"},
+        ]
+        calls = _request_body(mock_requests.call_args.kwargs)
+        assert [c["params"]["name"] for c in calls] == ["acknowledge_message", "acknowledge_message"]
+
+    def test_batch_unsupported_status_falls_back(self, mock_agent_mail_env, mock_requests):
+        """Test that a 405 on a batch falls back to single calls and isn't retried later."""
+        def respond(**kwargs):
+            if isinstance(_request_body(kwargs), list):
+                return _Resp(405, b'{"detail": "Method Not Allowed"}')
+            return _Resp(200, {})
+
+        mock_requests.side_effect = respond
+
+        results = mail_ack_many(message_ids=[1, 2])
+
+        assert [r["acknowledged"] for r in results] == [True, True]
+        # Rejected batch + one ack call per message
+        assert mock_requests.call_count == 3
+
+        mail_ack_many(message_ids=[3, 4])
+        assert mock_requests.call_count == 5
+
+    def test_batch_internal_error_falls_back_without_caching(self, mock_agent_mail_env, mock_requests):
+        """Test that a generic 500 on a batch falls back for that call only."""
+        from beads_mcp import mail
+
+        def respond(**kwargs):
+            if isinstance(_request_body(kwargs), list):
+                return _Resp(500, b'{"detail": "Unknown method"}')
+            return _Resp(200, {})
+
+        mock_requests.side_effect = respond
+
+        results = mail_ack_many(message_ids=[1, 2])
+
+        assert [r["acknowledged"] for r in results] == [True, True]
+        assert mock_requests.call_count == 3
+        assert mail._BATCH_SUPPORTED is None
+
+    def test_batch_overload_raises_without_fanning_out(self, mock_agent_mail_env, mock_requests, no_backoff):
+        """Test that a 503 left after retries is raised and doesn't turn batching off."""
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(503, b'Service Unavailable')
+
+        with pytest.raises(MailError) as exc_info:
+            mail_ack_many(message_ids=[1, 2])
+
+        assert exc_info.value.code == "UNAVAILABLE"
+        assert mock_requests.call_count == mail.AGENT_MAIL_RETRIES + 1
+        assert all(isinstance(_request_body(call.kwargs), list) for call in mock_requests.call_args_list)
+        assert mail._BATCH_SUPPORTED is None
+
+    def test_batch_transport_error_raises(self, mock_agent_mail_env, mock_requests):
+        """Test that a connection failure on a batch is raised rather than treated as unsupported."""
+        from beads_mcp import mail
+
+        mock_requests.side_effect = httpx.ConnectError("Connection refused")
+
+        with pytest.raises(MailError) as exc_info:
+            mail_ack_many(message_ids=[1, 2])
+
+        assert exc_info.value.code == "UNAVAILABLE"
+        assert mail._BATCH_SUPPORTED is None
 
 
 class TestMailDelete:
     """Test mail_delete function."""
-    
+
     def test_delete_message(self, mock_agent_mail_env, mock_requests):
         """Test deleting/archiving a message."""
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {}
-        mock_requests.return_value.content = b'{}'
-        
+        mock_requests.return_value = _Resp(200, {})
+
         result = mail_delete(message_id=123)
-        
+
         assert result["archived"] is True
 
+    def test_delete_ignores_mark_failure(self, mock_agent_mail_env, mock_requests):
+        """Test that a message that can't be marked read still counts as archived."""
+        mock_requests.return_value = _Resp(404, b'{"error": "not found"}')
+
+        result = mail_delete(message_id=123)
+
+        assert result["archived"] is True
+
+    def test_delete_many_ignores_transport_errors(self, mock_agent_mail_env, mock_requests, no_backoff):
+        """Test that a timed-out batch is as soft a failure as it is for mail_delete."""
+        mock_requests.side_effect = httpx.ReadTimeout("timed out")
+
+        assert mail_delete(message_id=1) == {"archived": True}
+        assert mail_delete_many(message_ids=[1, 2]) == [
+            {"id": 1, "archived": True},
+            {"id": 2, "archived": True},
+        ]
+
+    def test_delete_many_falls_back_when_batch_unsupported(self, mock_agent_mail_env, mock_requests):
+        """Test that deleting several messages without batch support sends one call each."""
+        def respond(**kwargs):
+            if isinstance(json.loads(kwargs["content"]), list):
+                return _Resp(400, b'{"detail": "Unknown method"}')
+            return _Resp(200, {})
+
+        mock_requests.side_effect = respond
+
+        results = mail_delete_many(message_ids=[1, 2, 3])
+
+        assert [r["archived"] for r in results] == [True, True, True]
+        # Rejected batch + one mark-read call per message
+        assert mock_requests.call_count == 4
+
+
+class TestMailResponses:
+    """Test response decoding."""
+
+    def test_empty_content_length_skips_decoding(self, mock_agent_mail_env, mock_requests):
+        """Test that a Content-Length: 0 success returns {} without reading the body."""
+        import asyncio
+
+        from beads_mcp.mail import _call_agent_mail
+
+        mock_requests.return_value = _Resp(204, b"not json", headers={"Content-Length": "0"})
+
+        assert asyncio.run(_call_agent_mail("POST", "/mcp/call", json_data={})) == {}
+
+    def test_requests_carry_jsonrpc_ids(self, mock_agent_mail_env, mock_requests):
+        """Test that each envelope is a JSON-RPC 2.0 request with a fresh id."""
+        mock_requests.return_value = _Resp(200, {})
+
+        mail_ack(message_id=1)
+        mail_ack(message_id=2)
+
+        bodies = [_request_body(call.kwargs) for call in mock_requests.call_args_list]
+        assert [body["jsonrpc"] for body in bodies] == ["2.0", "2.0"]
+        assert bodies[0]["id"] != bodies[1]["id"]
+        assert bodies[1]["params"]["name"] == "acknowledge_message"
+
+    def test_request_body_sent_as_encoded_bytes(self, mock_agent_mail_env, mock_requests):
+        """Test that the envelope is pre-encoded and sent with an explicit Content-Type."""
+        mock_requests.return_value = _Resp(200, {
+            "deliveries": [{"payload": {"id": 1, "thread_id": None}}]
+        })
+
+        mail_send(to=["alice"], subject="Test", body="# Heading\n\n- item")
+
+        call_kwargs = mock_requests.call_args.kwargs
+        assert isinstance(call_kwargs["content"], bytes)
+        assert "json" not in call_kwargs
+        assert call_kwargs["headers"]["Content-Type"] == "application/json"
+        assert _request_body(call_kwargs)["params"]["arguments"]["body_md"] == "# Heading\n\n- item"
+
 
 class TestMailRetries:
     """Test retry logic and error handling."""
-    
-    def test_retries_on_server_error(self, mock_agent_mail_env, mock_requests):
-        """Test that 500 errors trigger retries."""
-        mock_requests.return_value.status_code = 500
-        mock_requests.return_value.content = b'Internal Server Error'
-        
+
+    def test_retries_on_server_error(self, mock_agent_mail_env, mock_requests, no_backoff):
+        """Test that 503 errors trigger retries."""
+        mock_requests.return_value = _Resp(503, b'Service Unavailable')
+
         with pytest.raises(MailError) as exc_info:
             mail_send(to=["alice"], subject="Test", body="Test")
-        
+
         assert exc_info.value.code == "UNAVAILABLE"
         # Should retry 3 times total (initial + 2 retries)
         assert mock_requests.call_count == 3
-    
+        assert no_backoff.call_count == 2
+
+    def test_retries_reuse_idempotency_key(self, mock_agent_mail_env, mock_requests, no_backoff):
+        """Test that every retry of a write carries the same Idempotency-Key."""
+        mock_requests.return_value = _Resp(503, b'Service Unavailable')
+
+        with pytest.raises(MailError):
+            mail_send(to=["alice"], subject="Test", body="Test")
+
+        keys = {call.kwargs["headers"]["Idempotency-Key"] for call in mock_requests.call_args_list}
+        assert mock_requests.call_count == 3
+        assert len(keys) == 1
+
+    def test_no_retry_on_write_internal_error(self, mock_agent_mail_env, mock_requests):
+        """Test that a 500 on a write is surfaced without replaying it."""
+        mock_requests.return_value = _Resp(500, b'Internal Server Error')
+
+        with pytest.raises(MailError) as exc_info:
+            mail_send(to=["alice"], subject="Test", body="Test")
+
+        assert exc_info.value.code == "UNAVAILABLE"
+        assert exc_info.value.data["status"] == 500
+        assert mock_requests.call_count == 1
+
+    def test_retries_read_on_internal_error(self, mock_agent_mail_env, mock_requests, no_backoff):
+        """Test that a 500 on an idempotent read is retried."""
+        mock_requests.return_value = _Resp(500, b'Internal Server Error')
+
+        with pytest.raises(MailError) as exc_info:
+            mail_read(message_id=123, mark_read=False)
+
+        assert exc_info.value.code == "UNAVAILABLE"
+        assert mock_requests.call_count == 3
+
+    def test_retry_backoff_is_jittered_and_capped(self, mock_agent_mail_env, mock_requests):
+        """Test that retry delays are randomized within the backoff bounds."""
+        from beads_mcp import mail
+
+        mock_requests.return_value = _Resp(503, b'Service Unavailable')
+
+        with (
+            patch("beads_mcp.mail.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+            pytest.raises(MailError),
+        ):
+            mail_send(to=["alice"], subject="Test", body="Test")
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == mail.AGENT_MAIL_RETRIES
+        for attempt, delay in enumerate(delays):
+            ceiling = min(mail.AGENT_MAIL_BACKOFF_MAX, mail.AGENT_MAIL_BACKOFF_BASE * 2**attempt)
+            assert mail.AGENT_MAIL_BACKOFF_MIN <= delay <= ceiling
+
+        for attempt in range(10):
+            assert mail._backoff_delay(attempt) <= mail.AGENT_MAIL_BACKOFF_MAX
+
     def test_no_retry_on_client_error(self, mock_agent_mail_env, mock_requests):
         """Test that 404 errors don't trigger retries."""
-        mock_requests.return_value.status_code = 404
-        mock_requests.return_value.json.return_value = {"detail": "Not found"}
-        mock_requests.return_value.content = b'{"detail": "Not found"}'
-        
+        mock_requests.return_value = _Resp(404, {"detail": "Not found"})
+
         with pytest.raises(MailError) as exc_info:
-            mail_read(message_id=999)
-        
+            mail_read(message_id=999, mark_read=False)
+
         assert exc_info.value.code == "NOT_FOUND"
         # Should not retry on 404
         assert mock_requests.call_count == 1
@@ -388,39 +1402,57 @@ class TestMailRetries:
 
 class TestMailToolWrappers:
     """Test MCP tool wrappers."""
-    
-    def test_mail_send_params(self, mock_agent_mail_env, mock_requests):
+
+    async def test_mail_send_params(self, mock_agent_mail_env, mock_requests):
         """Test MailSendParams validation."""
         from beads_mcp.mail_tools import beads_mail_send
-        
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = {
+
+        mock_requests.return_value = _Resp(200, {
             "deliveries": [{
                 "payload": {"id": 123, "thread_id": "t1"}
             }]
-        }
-        mock_requests.return_value.content = b'{}'
-        
+        })
+
         params = MailSendParams(
             to=["alice"],
             subject="Test",
             body="Hello",
             urgent=True,
         )
-        
-        result = beads_mail_send(params)
+
+        result = await beads_mail_send(params)
         assert result["message_id"] == 123
-    
-    def test_mail_inbox_default_params(self, mock_agent_mail_env, mock_requests):
+
+    async def test_mail_read_many_params(self, mock_agent_mail_env, mock_requests):
+        """Test MailReadManyParams wraps results in a messages list."""
+        from beads_mcp.mail_tools import beads_mail_read_many
+
+        mock_requests.side_effect = lambda **kwargs: _batch_response(
+            kwargs, [{"contents": [{"id": 1, "body_md": "Hi"}]}]
+        )
+
+        result = await beads_mail_read_many(MailReadManyParams(message_ids=[1, 1], mark_read=False))
+
+        assert [m["body"] for m in result["messages"]] == ["Hi", "Hi"]
+
+    async def test_mail_ack_many_params(self, mock_agent_mail_env, mock_requests):
+        """Test MailAckManyParams wraps results in a results list."""
+        from beads_mcp.mail_tools import beads_mail_ack_many
+
+        mock_requests.side_effect = lambda **kwargs: _batch_response(kwargs, [{}, {}])
+
+        result = await beads_mail_ack_many(MailAckManyParams(message_ids=[1, 2]))
+
+        assert [r["acknowledged"] for r in result["results"]] == [True, True]
+
+    async def test_mail_inbox_default_params(self, mock_agent_mail_env, mock_requests):
         """Test MailInboxParams with defaults."""
         from beads_mcp.mail_tools import beads_mail_inbox
-        
-        mock_requests.return_value.status_code = 200
-        mock_requests.return_value.json.return_value = []
-        mock_requests.return_value.content = b'[]'
-        
+
+        mock_requests.return_value = _Resp(200, [])
+
         params = MailInboxParams()  # All defaults
-        result = beads_mail_inbox(params)
-        
+        result = await beads_mail_inbox(params)
+
         assert result["messages"] == []
         assert result["next_cursor"] is None